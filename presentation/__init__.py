@@ -0,0 +1,10 @@
+"""
+NGO-Connect: Stakeholder Presentation Generator
+
+Importable API for the architecture deck. Importing this package is cheap;
+python-pptx is only loaded when a deck is built or rendered.
+"""
+
+from .deck import IndexWarning, SLIDES, SlideSpec, build_presentation, render, select_slides
+
+__all__ = ["IndexWarning", "SLIDES", "SlideSpec", "build_presentation", "render", "select_slides"]
@@ -0,0 +1,401 @@
+"""
+Bulk certificate rendering from a certificates export.
+
+    python -m presentation.certificates certs.jsonl -o certificates/
+    python -m presentation.certificates certs.csv -o out/ --per-file 500 -j 8
+    python -m presentation.certificates --sample 5000 -o /tmp/certs   # load test
+
+Each record of a ``certificates_rel`` export (JSONL, or CSV with the
+``metadata`` column as JSON) becomes one certificate slide, laid out like
+``backend/src/utils/certificateTemplates.js`` with the deck's primitives.
+Records are streamed in batches to a process pool, so the export is never
+held in memory; ``manifest.csv`` maps every certificate id to its file and
+slide. A record that cannot be rendered (unparseable row, non-numeric
+amount ...) is listed in the manifest with its error and skipped; the rest
+of the run carries on.
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import re
+import sys
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from . import i18n
+from .components import Component
+from .primitives import (
+    Emu, Inches, Pt, RGBColor, PP_ALIGN, MSO_SHAPE,
+    NAVY, TEAL, WHITE, LIGHT_BG, GREY_TEXT, SLIDE_W, SLIDE_H,
+    add_bg_rect, add_accent_bar, add_text_box,
+)
+
+RECIPIENT = RGBColor(0x0B, 0x3D, 0x36)
+
+Certificate = namedtuple("Certificate", "id type title number issued_at metadata error",
+                         defaults=(None,))
+
+MANIFEST_FIELDS = ("certificate_id", "certificate_number", "type", "file", "slide", "error")
+
+# Mirrors PAYMENT_METHOD_LABELS in certificateTemplates.js.
+PAYMENT_METHOD_LABELS = {
+    "card": "Card",
+    "upi": "UPI",
+    "netbanking": "Net Banking",
+    "wallet": "Wallet",
+    "bank-transfer": "Bank Transfer",
+    "cash": "Cash",
+}
+
+
+# ── Input ───────────────────────────────────────────────────────
+def read_records(path):
+    """Yield :class:`Certificate` records from a ``.csv`` or ``.jsonl`` export.
+
+    A row that cannot be parsed is yielded with only ``error`` set.
+    """
+    with open(path, encoding="utf-8", newline="") as fh:
+        if path.endswith(".csv"):
+            rows = csv.DictReader(fh)
+        else:
+            rows = (line for line in fh if line.strip())
+        for number, row in enumerate(rows, 1):
+            try:
+                cert = to_certificate(row if isinstance(row, dict) else json.loads(row))
+            except (ValueError, TypeError, AttributeError) as exc:
+                cert = Certificate("", "", "", "", "", {}, f"record {number}: {exc}")
+            yield cert
+
+
+def to_certificate(row):
+    """Normalise a DB-export (snake_case) or API (camelCase) row."""
+    metadata = row.get("metadata") or {}
+    if isinstance(metadata, str):
+        metadata = json.loads(metadata)
+    return Certificate(
+        id=str(row.get("external_id") or row.get("id") or ""),
+        type=row.get("certificate_type") or row.get("type") or "donation",
+        title=row.get("title") or "",
+        number=row.get("certificate_number") or row.get("certificateNumber") or "",
+        issued_at=row.get("issued_at") or row.get("issuedAt") or "",
+        metadata=metadata,
+    )
+
+
+def sample_records(count, seed=0):
+    """Synthetic certificates for load tests."""
+    names = ("Aarav Sharma", "Diya Patel", "Kabir Rao", "Meera Iyer", "Rohan Gupta", "Sara Khan")
+    ngos = ("Namma Lake Guardians", "Bengaluru Food Rescue Alliance", "Samarthanam Trust")
+    campaigns = ("Lake Revival Drive", "Meals for Every Child", "Inclusive Skills Lab")
+    for i in range(seed, seed + count):
+        donation = i % 3 != 2
+        yield Certificate(
+            id=f"cert-{i:07d}",
+            type="donation" if donation else "volunteer",
+            title="Certificate of Generous Contribution" if donation
+            else "Certificate of Volunteer Service",
+            number=f"{'DON' if donation else 'VOL'}-20261231-{i:06X}",
+            issued_at="2026-12-31T10:00:00.000Z",
+            metadata={
+                "recipientName": names[i % len(names)],
+                "ngoName": ngos[i % len(ngos)],
+                "campaignTitle": campaigns[i % len(campaigns)],
+                "contributionAmount": 500 + (i * 37) % 100_000,
+                "paymentMethod": ("upi", "card", "netbanking")[i % 3],
+                "assignedTask": "Community outreach",
+                "activityHours": 4 + i % 20,
+            },
+        )
+
+
+# ── Formatting (as in certificateTemplates.js) ──────────────────
+def format_date(value):
+    """``14 February 2026``, like ``toLocaleDateString('en-IN', ...)``."""
+    try:
+        d = date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return str(value)
+    return f"{d.day:02d} {d:%B %Y}"
+
+
+def format_inr(amount):
+    """Indian digit grouping: ₹1,00,000 (``toLocaleString('en-IN')``)."""
+    whole, _, fraction = f"{amount:.3f}".rstrip("0").partition(".")
+    head, tail = whole[:-3], whole[-3:]
+    groups = []
+    while len(head) > 2:
+        groups.insert(0, head[-2:])
+        head = head[:-2]
+    if head:
+        groups.insert(0, head)
+    return "₹" + ",".join(groups + [tail]) + (f".{fraction}" if fraction else "")
+
+
+def _slug(value):
+    return re.sub(r"[^a-z0-9]+", "-", str(value).strip().lower()).strip("-")
+
+
+def certificate_slug(cert, fallback="document"):
+    """File stem like ``toCertificateSlug``: ``<title>-<number>-<id>``, slugged.
+
+    Certificate numbers are free text and not unique, so the id is added
+    (or *fallback* when the record has none) to keep names distinct.
+    """
+    parts = (_slug(cert.title) or "certificate", _slug(cert.number),
+             _slug(cert.id) or _slug(fallback))
+    return "-".join(part for part in parts if part)
+
+
+def certificate_text(cert):
+    """The slot values the certificate slide is drawn with."""
+    t = i18n.t
+    meta = cert.metadata
+    ngo = meta.get("ngoName") or t("certificate.default_ngo")
+    campaign = (meta.get("campaignTitle") or meta.get("activityTitle")
+                or t("certificate.default_campaign"))
+    issued = format_date(cert.issued_at) if cert.issued_at else format_date(date.today())
+
+    if cert.type == "donation":
+        amount = float(meta.get("contributionAmount") or 0)
+        copy = t("certificate.donation_copy").format(
+            amount=format_inr(amount) if amount > 0 else "", campaign=campaign, ngo=ngo)
+        method = meta.get("paymentMethod")
+        secondary = t("certificate.payment").format(
+            method=PAYMENT_METHOD_LABELS.get(method) or method or t("certificate.default_payment"))
+    else:
+        copy = t("certificate.volunteer_copy").format(
+            campaign=campaign, ngo=ngo,
+            task=meta.get("assignedTask") or t("certificate.default_task"))
+        completed = meta.get("completionDate")
+        secondary = t("certificate.completion").format(
+            date=format_date(completed) if completed else issued)
+        hours = float(meta.get("activityHours") or 0)
+        if hours > 0:
+            secondary += t("certificate.hours").format(hours=f"{hours:g}")
+
+    return {
+        "title": cert.title or t("certificate.default_title"),
+        "recipient": meta.get("recipientName") or t("certificate.default_recipient"),
+        "copy": copy,
+        "secondary": secondary,
+        "number": cert.number or "N/A",
+        "issued": issued,
+        "ngo": ngo,
+        "activity": campaign,
+    }
+
+
+# ── Rendering ───────────────────────────────────────────────────
+def add_certificate(slide, **text):
+    """One certificate page; *text* is :func:`certificate_text`'s slots."""
+    CERTIFICATE.add(slide, **text)
+
+
+def _draw_certificate(sl, left, top, title, recipient, copy, secondary,
+                      number, issued, ngo, activity):
+    add_bg_rect(sl, LIGHT_BG)
+    sheet = sl.shapes.add_shape(
+        MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.6), Inches(0.45),
+        SLIDE_W - Inches(1.2), SLIDE_H - Inches(0.9),
+    )
+    sheet.adjustments[0] = 0.04
+    sheet.fill.solid()
+    sheet.fill.fore_color.rgb = WHITE
+    sheet.line.color.rgb = TEAL
+    sheet.line.width = Pt(6)
+    sheet.shadow.inherit = False
+    add_accent_bar(sl, y=Emu(0), height=Inches(0.12), color=TEAL)
+    add_accent_bar(sl, y=SLIDE_H - Inches(0.12), height=Inches(0.12), color=TEAL)
+
+    add_text_box(sl, Inches(1.2), Inches(0.95), Inches(10.9), Inches(0.4),
+                 i18n.t("certificate.brand").upper(), 14, bold=True, color=TEAL,
+                 alignment=PP_ALIGN.CENTER)
+    add_text_box(sl, Inches(1.2), Inches(1.4), Inches(10.9), Inches(0.9),
+                 title, 40, bold=True, color=NAVY, alignment=PP_ALIGN.CENTER)
+    add_text_box(sl, Inches(1.2), Inches(2.3), Inches(10.9), Inches(0.4),
+                 i18n.t("certificate.subtitle"), 14, color=GREY_TEXT,
+                 alignment=PP_ALIGN.CENTER)
+    add_text_box(sl, Inches(1.2), Inches(2.85), Inches(10.9), Inches(0.8),
+                 recipient, 34, bold=True, color=RECIPIENT, alignment=PP_ALIGN.CENTER)
+    add_text_box(sl, Inches(1.7), Inches(3.7), Inches(9.9), Inches(0.9),
+                 copy, 17, alignment=PP_ALIGN.CENTER)
+    add_text_box(sl, Inches(1.7), Inches(4.6), Inches(9.9), Inches(0.4),
+                 secondary, 14, color=GREY_TEXT, alignment=PP_ALIGN.CENTER)
+
+    divider = sl.shapes.add_shape(
+        MSO_SHAPE.RECTANGLE, Inches(1.2), Inches(5.3), Inches(10.9), Pt(1.5),
+    )
+    divider.fill.solid()
+    divider.fill.fore_color.rgb = TEAL
+    divider.line.fill.background()
+    divider.shadow.inherit = False
+
+    labels = i18n.t("certificate.meta")
+    for i, value in enumerate((number, issued, ngo, activity)):
+        x = Inches(1.2) + Inches(i * 2.75)
+        add_text_box(sl, x, Inches(5.5), Inches(2.6), Inches(0.35),
+                     labels[i].upper(), 11, bold=True, color=GREY_TEXT)
+        add_text_box(sl, x, Inches(5.85), Inches(2.6), Inches(0.7),
+                     value, 14, bold=True, color=NAVY)
+
+
+CERTIFICATE = Component("certificate", _draw_certificate)
+
+
+# One blank deck per worker process, reused for every file it writes:
+# opening the default template and re-recording the CERTIFICATE component
+# per file would cost more than drawing the certificate itself.
+_deck = None
+
+
+def _blank_deck():
+    global _deck
+    if _deck is None:
+        from pptx import Presentation
+
+        prs = Presentation()
+        prs.slide_width = SLIDE_W
+        prs.slide_height = SLIDE_H
+        blank = prs.slide_layouts.get_by_name("Blank")
+        for layout in list(prs.slide_layouts):
+            if layout is not blank:
+                prs.slide_layouts.remove(layout)
+        _deck = prs, blank
+    return _deck
+
+
+def _render_batch(batch, out_dir, file_name, locale):
+    """Render *batch* (``(sequence, cert)`` pairs) into one pptx.
+
+    Returns manifest rows; records that fail get an error row and no slide.
+    """
+    prs, blank = _blank_deck()
+    rows = []
+    name = file_name
+    with i18n.use_locale(locale):
+        for sequence, cert in batch:
+            try:
+                if cert.error:
+                    raise ValueError(cert.error)
+                text = certificate_text(cert)
+            except (ValueError, TypeError, AttributeError) as exc:
+                rows.append((cert.id, cert.number, cert.type, "", "", str(exc)))
+                continue
+            add_certificate(prs.slides.add_slide(blank), **text)
+            name = file_name or certificate_slug(cert, f"{sequence:07d}") + ".pptx"
+            rows.append((cert.id, cert.number, cert.type, name, len(prs.slides), ""))
+    if not len(prs.slides):
+        return rows
+    try:
+        prs.save(os.path.join(out_dir, name))
+    finally:
+        id_list = prs.slides._sldIdLst
+        for sld_id in list(id_list):
+            prs.part.drop_rel(sld_id.rId)
+            id_list.remove(sld_id)
+    return rows
+
+
+def render_certificates(records, out_dir, per_file=1, workers=None, chunk=50,
+                        locale=i18n.DEFAULT_LOCALE, manifest=None):
+    """Render *records* (any iterable) into *out_dir* across a process pool.
+
+    *per_file* certificates share one pptx (``certificates-00001.pptx``
+    ...); with 1, each file is named after the certificate like the
+    backend's HTML documents. At most ``2 * workers`` batches are in flight,
+    so *records* is consumed lazily. Records that fail are listed in the
+    manifest with their error. Returns ``(count, failed, seconds)``.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = manifest or os.path.join(out_dir, "manifest.csv")
+    workers = workers or os.cpu_count() or 1
+    size = per_file if per_file > 1 else chunk
+
+    started = time.perf_counter()
+    count = failed = 0
+    records = enumerate(records, 1)
+    with open(manifest, "w", encoding="utf-8", newline="") as fh, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        writer = csv.writer(fh)
+        writer.writerow(MANIFEST_FIELDS)
+        pending = deque()
+
+        def drain(limit):
+            nonlocal count, failed
+            while len(pending) > limit:
+                for rows in pending.popleft().result():
+                    writer.writerows(rows)
+                    errors = sum(1 for row in rows if row[-1])
+                    count += len(rows) - errors
+                    failed += errors
+
+        for index in itertools.count(1):
+            batch = list(itertools.islice(records, size))
+            if not batch:
+                break
+            if per_file > 1:
+                pending.append(pool.submit(
+                    _collect, [batch], out_dir, f"certificates-{index:05d}.pptx", locale))
+            else:
+                pending.append(pool.submit(
+                    _collect, [[item] for item in batch], out_dir, None, locale))
+            drain(2 * workers)
+        drain(0)
+    return count, failed, time.perf_counter() - started
+
+
+def _collect(batches, out_dir, file_name, locale):
+    return [_render_batch(batch, out_dir, file_name, locale) for batch in batches]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m presentation.certificates",
+        description="Render certificates from a CSV/JSONL export, one slide each.",
+    )
+    parser.add_argument("input", nargs="?", help="certificates export (.csv or .jsonl)")
+    parser.add_argument("-o", "--output", default="certificates", help="output directory")
+    parser.add_argument("--per-file", type=int, default=1, metavar="N",
+                        help="certificates per pptx (default: one file each)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument("-l", "--locale", default=i18n.DEFAULT_LOCALE,
+                        help="catalog locale for the fixed wording")
+    parser.add_argument("--manifest", default=None,
+                        help="manifest path (default: OUTPUT/manifest.csv)")
+    parser.add_argument("--sample", type=int, default=None, metavar="N",
+                        help="render N synthetic certificates instead of INPUT")
+    args = parser.parse_args(argv)
+
+    if args.sample:
+        records = sample_records(args.sample)
+    elif args.input:
+        records = read_records(args.input)
+    else:
+        parser.error("an input export or --sample is required")
+    try:
+        i18n.load_catalog(args.locale)
+    except ValueError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+
+    count, failed, seconds = render_certificates(
+        records, args.output, per_file=max(1, args.per_file), workers=args.jobs,
+        locale=args.locale, manifest=args.manifest)
+    rate = count / seconds if seconds else 0
+    print(f"✅ {count:,} certificates saved to: {args.output}")
+    print(f"   {seconds:.1f}s, {rate:,.0f} certificates/s")
+    if failed:
+        print(f"⚠️  {failed:,} certificates failed; see the error column in "
+              f"{args.manifest or os.path.join(args.output, 'manifest.csv')}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""
+Native, data-driven PowerPoint charts.
+
+A chart is one graphic frame whose bars, labels and scale come from the
+series data, so a distribution slide costs a constant number of shapes no
+matter how many data points it shows. Points that do not fit on one slide
+spill onto continuation slides that share the same value scale.
+"""
+
+import math
+from collections import namedtuple
+
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE, XL_LABEL_POSITION
+
+from .primitives import Inches, Pt, DARK_TEXT, TEAL, set_font
+
+Point = namedtuple("Point", "label value color")
+Point.__new__.__defaults__ = (None,)
+
+
+def nice_ceiling(value):
+    """Smallest 1/2/5 x 10^n that is >= *value* (used as the axis maximum)."""
+    if value <= 0:
+        return 1
+    magnitude = 10 ** math.floor(math.log10(value))
+    for step in (1, 2, 5, 10):
+        if step * magnitude >= value:
+            return step * magnitude
+    return 10 * magnitude
+
+
+def paginate(points, per_page, sort=True):
+    """Split *points* into pages of at most *per_page*, largest first if *sort*."""
+    points = [p if isinstance(p, Point) else Point(*p) for p in points]
+    if sort:
+        points.sort(key=lambda p: p.value, reverse=True)
+    return [points[i:i + per_page] for i in range(0, len(points), per_page)]
+
+
+def add_bar_chart(slide, left, top, width, height, points, value_max=None,
+                  number_format="0", font_size=14, default_color=TEAL):
+    """Horizontal bar chart, one bar per point, drawn top-down in given order.
+
+    *value_max* pins the axis so several charts share a scale; by default
+    it is rounded up from the largest value. Returns the graphic frame.
+    """
+    points = [p if isinstance(p, Point) else Point(*p) for p in points]
+
+    data = CategoryChartData(number_format=number_format)
+    data.categories = [p.label for p in points]
+    data.add_series("value", [p.value for p in points])
+
+    frame = slide.shapes.add_chart(
+        XL_CHART_TYPE.BAR_CLUSTERED, left, top, width, height, data,
+    )
+    chart = frame.chart
+    chart.has_legend = False
+    chart.font.size = Pt(font_size)
+    set_font(chart.font)
+    chart.font.color.rgb = DARK_TEXT
+
+    plot = chart.plots[0]
+    plot.gap_width = 55
+    plot.vary_by_categories = False
+    plot.has_data_labels = True
+    labels = plot.data_labels
+    labels.number_format = number_format
+    labels.number_format_is_linked = False
+    labels.position = XL_LABEL_POSITION.OUTSIDE_END
+    labels.font.bold = True
+    labels.font.size = Pt(font_size + 2)
+
+    for point, p in zip(plot.series[0].points, points):
+        point.format.fill.solid()
+        point.format.fill.fore_color.rgb = p.color or default_color
+        point.format.line.fill.background()
+
+    category_axis = chart.category_axis
+    category_axis.reverse_order = True  # first point on top
+    category_axis.tick_labels.font.bold = True
+    category_axis.format.line.fill.background()
+    category_axis.has_major_gridlines = False
+
+    value_axis = chart.value_axis
+    value_axis.minimum_scale = 0
+    value_axis.maximum_scale = value_max or nice_ceiling(
+        max((p.value for p in points), default=0) * 1.1)
+    value_axis.has_major_gridlines = False
+    value_axis.visible = False
+
+    return frame
+
+
+def add_distribution(slide, points, header=None, per_chart=7, columns=2,
+                     sort=True, left=Inches(0.5), top=Inches(1.4),
+                     width=Inches(12.3), height=Inches(5.1), **chart_kwargs):
+    """Lay *points* out as *columns* bar charts per slide, paging on overflow.
+
+    Pages beyond the first slide go onto continuation slides inserted in
+    build order; *header* (``header(slide, page_index)``) is called on each
+    continuation slide to draw its background and title. All charts share
+    one value scale. Returns the list of slides used.
+    """
+    pages = paginate(points, per_chart, sort=sort)
+    if not pages:
+        return [slide]
+    value_max = nice_ceiling(max(p.value for page in pages for p in page) * 1.1)
+
+    gap = Inches(0.3)
+    col_w = int((width - gap * (columns - 1)) / columns)
+    row_h = int(height / per_chart)
+
+    slides = [slide]
+    for i, page in enumerate(pages):
+        col = i % columns
+        if i and not col:
+            slide = add_continuation_slide(slide)
+            if header is not None:
+                header(slide, len(slides))
+            slides.append(slide)
+        add_bar_chart(slide, left + col * (col_w + gap), top,
+                      col_w, row_h * len(page), page,
+                      value_max=value_max, **chart_kwargs)
+    return slides
+
+
+def add_continuation_slide(slide):
+    """Append a slide with *slide*'s layout to the same presentation."""
+    prs = slide.part.package.presentation_part.presentation
+    return prs.slides.add_slide(slide.slide_layout)
@@ -0,0 +1,152 @@
+"""
+Command-line entry point for the deck generator.
+
+    python generate_presentation.py                       # full deck
+    python generate_presentation.py --list-slides
+    python generate_presentation.py -s 13 -o api.pptx     # one slide
+    python generate_presentation.py -s 1-3,closing -f pdf
+    python generate_presentation.py -l en,hi              # one deck per locale
+    python generate_presentation.py --fixture load.npz    # chart another dataset
+    python generate_presentation.py --api http://localhost:5001/api   # + dashboard appendix
+    python generate_presentation.py --no-index            # skip the search index
+"""
+
+import argparse
+import os
+import sys
+import warnings
+
+from . import i18n
+from .deck import (
+    DEFAULT_OUTPUT, FORMATS, LIVE_SLIDES, SLIDES, IndexWarning,
+    _resolve_format, render, render_locales, select_slides,
+)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="generate_presentation.py",
+        description="Generate the NGO-Connect architecture presentation.",
+    )
+    parser.add_argument(
+        "-o", "--output", default=None,
+        help=f"output file (default: {DEFAULT_OUTPUT})",
+    )
+    parser.add_argument(
+        "-s", "--slides", default=None, metavar="SEL",
+        help="comma-separated slide numbers, ranges (5-7) or keys (default: all)",
+    )
+    parser.add_argument(
+        "-f", "--format", choices=FORMATS, default=None,
+        help="output format (default: from the output extension, else pptx)",
+    )
+    parser.add_argument(
+        "-l", "--locale", default=None, metavar="CODES",
+        help="catalog locale, or a comma-separated list to build one deck per "
+             "locale in parallel (default: en)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="worker processes for multi-locale builds (default: one per locale)",
+    )
+    parser.add_argument(
+        "--fixture", default=None, metavar="PATH",
+        help="seed.js or .npz fixture for the seed-data slides "
+             "(default: backend/seed.js)",
+    )
+    parser.add_argument(
+        "--api", default=None, metavar="URL",
+        help="backend API base URL; adds the admin dashboard appendix "
+             "(auth: API_TOKEN, or ADMIN_EMAIL/ADMIN_PASSWORD)",
+    )
+    parser.add_argument(
+        "--index", default=None, metavar="DIR",
+        help="search index to add the deck's text to (default: $DECK_INDEX or "
+             "~/.cache/ngo-connect-deck/index; query with python -m presentation.search)",
+    )
+    parser.add_argument(
+        "--no-index", action="store_true",
+        help="do not update the search index",
+    )
+    parser.add_argument(
+        "--list-slides", action="store_true",
+        help="print the slide catalogue and exit",
+    )
+    parser.add_argument(
+        "--list-locales", action="store_true",
+        help="print the available locales and exit",
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.list_slides:
+        for number, spec in enumerate(SLIDES, 1):
+            live = "  (needs --api)" if spec.key in LIVE_SLIDES else ""
+            print(f"{number:>3}  {spec.key:<22}  {spec.title}{live}")
+        return 0
+    if args.list_locales:
+        for code in i18n.available_locales():
+            print(f"{code:<6}  {i18n.load_catalog(code).name}")
+        return 0
+
+    output_path = args.output
+    if output_path is None:
+        output_path = DEFAULT_OUTPUT
+        if args.format and args.format != "pptx":
+            output_path = output_path.rsplit(".", 1)[0] + "." + args.format
+
+    locales = [code.strip() for code in (args.locale or "").split(",") if code.strip()]
+    try:
+        select_slides(args.slides, live=args.api is not None)
+        for code in locales:
+            i18n.load_catalog(code)
+        _resolve_format(output_path, args.format)
+        if args.fixture is not None and not os.path.isfile(args.fixture):
+            raise ValueError(f"Fixture not found: {args.fixture}")
+    except ValueError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+
+    # Imported here: the HTTP client is only needed with --api, and the
+    # index once a deck is built.
+    if args.api is not None:
+        from .dashboard import ApiError
+    else:
+        ApiError = ()  # nothing to catch
+
+    index = None
+    if not args.no_index:
+        from .search import DEFAULT_INDEX
+
+        index = args.index or DEFAULT_INDEX
+
+    try:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", IndexWarning)
+            if len(locales) > 1:
+                results = render_locales(locales, output_path, slides=args.slides,
+                                         fmt=args.format, workers=args.jobs,
+                                         fixture=args.fixture, api=args.api, index=index)
+            else:
+                count = render(output_path, slides=args.slides, fmt=args.format,
+                               locale=locales[0] if locales else None,
+                               fixture=args.fixture, api=args.api, index=index)
+                results = {None: (output_path, count)}
+    except ApiError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+
+    for code, (path, count) in results.items():
+        prefix = f"[{code}] " if code else ""
+        print(f"✅ {prefix}Presentation saved to: {path}")
+        print(f"   Slides: {count}")
+    for warning in caught:
+        if issubclass(warning.category, IndexWarning):
+            print(f"warning: {warning.message}", file=sys.stderr)
+        else:
+            warnings.showwarning(warning.message, warning.category,
+                                 warning.filename, warning.lineno)
+    return 0
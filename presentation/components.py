@@ -0,0 +1,291 @@
+"""
+Component instancing: draw a group of shapes once, then stamp out copies.
+
+A :class:`Component` wraps a draw function. The first time it is added to
+a deck it draws normally, but with marker values in place of its text and
+colour arguments, and keeps a copy of the finished shape XML. Every later
+instance deep-copies that XML, moves it, renumbers shape ids, re-points
+relationships at the new slide and writes the real text and colours in.
+
+    python -m presentation.components --bench 300   # drawn vs instanced
+
+The result is the XML python-pptx would have produced, at a fraction of
+the cost of building each shape through its object model.
+"""
+
+import argparse
+import copy
+import re
+import sys
+import time
+import weakref
+from contextlib import contextmanager
+
+from pptx.dml.color import RGBColor
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+from pptx.text.text import _Paragraph
+
+from . import i18n
+
+_R_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_TEXT_MARK = "\ue002%d\ue003"  # private-use, like the i18n tokens
+_XFRM_PARENTS = (qn("p:spPr"), qn("p:grpSpPr"))
+_A_P, _A_R, _A_T, _A_BR = qn("a:p"), qn("a:r"), qn("a:t"), qn("a:br")
+_A_OFF, _A_XFRM, _P_XFRM = qn("a:off"), qn("a:xfrm"), qn("p:xfrm")
+_A_SRGBCLR, _P_CNVPR = qn("a:srgbClr"), qn("p:cNvPr")
+_LINE_BREAK = re.compile("\n|\v")
+_NUMBERED_NAME = re.compile(r"^(.*) (\d+)$")
+
+# Prototypes per presentation package, so separate decks never share XML.
+_prototypes = weakref.WeakKeyDictionary()
+_enabled = True
+
+
+@contextmanager
+def instancing(enabled=True):
+    """Turn cloning on or off (off draws every instance from scratch)."""
+    global _enabled
+    saved = _enabled
+    _enabled = enabled
+    try:
+        yield
+    finally:
+        _enabled = saved
+
+
+class _Prototype:
+    def __init__(self, part, elements, origin, text_slots, list_slots, color_slots):
+        # Weak: the part holds its package, which keys the prototype cache.
+        self.part = weakref.ref(part)
+        self.elements = elements
+        self.origin = origin
+        self.linked = any(
+            attr.startswith(_R_NS) for el in elements for node in el.iter() for attr in node.attrib
+        )
+        self.text_slots = text_slots      # marker text -> slot name
+        self.list_slots = list_slots      # marker text -> slot name (one paragraph per item)
+        self.color_slots = color_slots    # marker hex  -> slot name
+
+
+class Component:
+    """Shapes drawn by ``draw(slide, left, top, **kwargs)``, instanced by cloning.
+
+    String keyword arguments are text slots, lists of strings are bullet
+    slots (one paragraph per item) and ``RGBColor`` values are colour
+    slots; they may differ freely between instances. Any other argument
+    (sizes, flags) selects a separate prototype, as does leaving a slot
+    empty, so *draw* may branch on those. Components must not contain
+    charts: a chart part cannot be shared between slides.
+    """
+
+    def __init__(self, name, draw):
+        self.name = name
+        self.draw = draw
+
+    def __repr__(self):
+        return f"Component({self.name!r})"
+
+    def add(self, slide, left=0, top=0, **kwargs):
+        if not _enabled:
+            return self.draw(slide, left, top, **kwargs)
+
+        slots, fixed = {}, {}
+        for key, value in kwargs.items():
+            if isinstance(value, (str, RGBColor, list)):
+                slots[key] = value
+            else:
+                fixed[key] = value
+        empty = frozenset(key for key, value in slots.items() if not value)
+        locale = i18n.current()
+        variant = (self.name, locale.code, i18n.is_template(),
+                   tuple(sorted(fixed.items())), empty)
+
+        cache = _prototypes.setdefault(slide.part.package, {})
+        proto = cache.get(variant)
+        if proto is None:
+            proto, elements = self._record(slide, left, top, slots, fixed, empty)
+            cache[variant] = proto
+        else:
+            elements = _clone(proto, slide, left, top)
+        _fill(proto, elements, slots)
+
+    def _record(self, slide, left, top, slots, fixed, empty):
+        text_slots, list_slots, color_slots, markers = {}, {}, {}, {}
+        for i, (key, value) in enumerate(slots.items()):
+            if key in empty:
+                markers[key] = value
+            elif isinstance(value, RGBColor):
+                markers[key] = RGBColor(0xFE, 0x0D, i)
+                color_slots[str(markers[key])] = key
+            elif isinstance(value, list):
+                markers[key] = [_TEXT_MARK % i]
+                list_slots[_TEXT_MARK % i] = key
+            else:
+                markers[key] = _TEXT_MARK % i
+                text_slots[_TEXT_MARK % i] = key
+
+        before = len(_shape_elements(slide))
+        self.draw(slide, left, top, **fixed, **markers)
+        live = _shape_elements(slide)[before:]
+
+        proto = _Prototype(slide.part, [copy.deepcopy(el) for el in live], (left, top),
+                           text_slots, list_slots, color_slots)
+        return proto, live
+
+
+def _shape_elements(slide):
+    return [el for el in slide.shapes._spTree.iterchildren()
+            if el.tag not in (qn("p:nvGrpSpPr"), qn("p:grpSpPr"), qn("p:extLst"))]
+
+
+def _clone(proto, slide, left, top):
+    """Copy *proto*'s shapes onto *slide* at (*left*, *top*); returns them."""
+    tree = slide.shapes._spTree
+    next_id = max((int(i) for i in tree.xpath("//p:cNvPr/@id")), default=0) + 1
+    dx, dy = left - proto.origin[0], top - proto.origin[1]
+    part = slide.part
+
+    elements = []
+    for source in proto.elements:
+        el = copy.deepcopy(source)
+        if dx or dy:
+            off = _offset(el)
+            if off is not None:
+                off.set("x", str(int(off.get("x")) + dx))
+                off.set("y", str(int(off.get("y")) + dy))
+        for cNvPr in el.iter(_P_CNVPR):
+            old_id = int(cNvPr.get("id"))
+            cNvPr.set("id", str(next_id))
+            m = _NUMBERED_NAME.match(cNvPr.get("name", ""))
+            if m and int(m.group(2)) == old_id - 1:
+                cNvPr.set("name", f"{m.group(1)} {next_id - 1}")
+            next_id += 1
+        if proto.linked and part is not proto.part():
+            _relink(el, proto.part(), part)
+        tree.insert_element_before(el, "p:extLst")
+        elements.append(el)
+    return elements
+
+
+def _offset(el):
+    """The ``a:off`` positioning a top-level shape element, if any."""
+    for child in el:
+        if child.tag in _XFRM_PARENTS:
+            xfrm = child.find(_A_XFRM)
+        elif child.tag == _P_XFRM:
+            xfrm = child
+        else:
+            continue
+        return xfrm.find(_A_OFF) if xfrm is not None else None
+    return None
+
+
+def _relink(el, source, target):
+    for node in el.iter():
+        for attr, rid in node.attrib.items():
+            if not attr.startswith(_R_NS):
+                continue
+            rel = source.rels[rid]
+            if rel.reltype == RT.CHART:
+                raise ValueError("Charts cannot be instanced; draw them directly")
+            if rel.is_external:
+                node.set(attr, target.relate_to(rel.target_ref, rel.reltype, is_external=True))
+            else:
+                node.set(attr, target.relate_to(rel.target_part, rel.reltype))
+
+
+def _fill(proto, elements, slots):
+    for el in elements:
+        for p in list(el.iter(_A_P)):
+            marker = "".join(t.text or "" for t in p.iter(_A_T))
+            if marker in proto.text_slots:
+                _set_text(p, slots[proto.text_slots[marker]])
+            elif marker in proto.list_slots:
+                items = slots[proto.list_slots[marker]]
+                for item in reversed(items[1:]):
+                    twin = copy.deepcopy(p)
+                    _set_text(twin, item)
+                    p.addnext(twin)
+                _set_text(p, items[0])
+        if proto.color_slots:
+            for clr in el.iter(_A_SRGBCLR):
+                key = proto.color_slots.get(clr.get("val"))
+                if key is not None:
+                    clr.set("val", str(slots[key]))
+
+
+def _set_text(p, text):
+    """Set paragraph *p*'s text the way ``_Paragraph.text`` would.
+
+    A marker paragraph holds a single run; line breaks become ``a:br``
+    between copies of it. Anything else goes through python-pptx.
+    """
+    runs = p.findall(_A_R)
+    lines = _LINE_BREAK.split(text)
+    if len(runs) != 1 or p.find(_A_BR) is not None or not all(lines):
+        _Paragraph(p, None).text = text
+        return
+    run = runs[0]
+    run.text = lines[0]
+    last = run
+    for line in lines[1:]:
+        br = p.makeelement(_A_BR, {})
+        twin = copy.deepcopy(run)
+        twin.text = line
+        last.addnext(br)
+        br.addnext(twin)
+        last = twin
+
+
+# ── Benchmark ───────────────────────────────────────────────────
+def _bench_deck(dividers, grids):
+    from pptx import Presentation
+
+    from . import slides as builders
+    from .primitives import SLIDE_W, SLIDE_H
+
+    prs = Presentation()
+    prs.slide_width = SLIDE_W
+    prs.slide_height = SLIDE_H
+    blank = prs.slide_layouts[6]
+    pages = [prs.slides.add_slide(blank) for _ in range(dividers + grids)]
+
+    started = time.perf_counter()
+    for i, sl in enumerate(pages[:dividers]):
+        builders.add_section_header(sl, f"Section {i + 1}", f"Divider subtitle {i + 1}")
+    for i, sl in enumerate(pages[dividers:]):
+        builders.build_features(sl) if i % 2 else builders.build_ai_features(sl)
+    return prs, time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m presentation.components",
+        description="Time drawing vs instancing section dividers and card grids.",
+    )
+    parser.add_argument("--bench", type=int, default=200, metavar="N",
+                        help="section dividers and card-grid slides to build (N of each)")
+    args = parser.parse_args(argv)
+
+    # Under ``python -m`` this file is __main__; the builders use the
+    # package's copy of the module, so switch instancing there.
+    from . import components
+
+    with components.instancing(False):
+        drawn, drawn_s = _bench_deck(args.bench, args.bench)
+    cloned, cloned_s = _bench_deck(args.bench, args.bench)
+
+    same = all(
+        a._element.xml == b._element.xml for a, b in zip(drawn.slides, cloned.slides)
+    )
+    shapes = sum(len(s.shapes) for s in cloned.slides)
+    print(f"{args.bench} dividers + {args.bench} card grids, {shapes:,} shapes")
+    print(f"  drawn      {drawn_s:7.3f}s")
+    print(f"  instanced  {cloned_s:7.3f}s  ({drawn_s / cloned_s:.1f}x)")
+    print(f"  slide XML identical: {'yes' if same else 'NO'}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
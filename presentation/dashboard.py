@@ -0,0 +1,309 @@
+"""
+Admin dashboard snapshot from the running API.
+
+    python -m presentation.dashboard                            # $API_BASE
+    python -m presentation.dashboard --api http://localhost:5001/api
+    python -m presentation.dashboard --record admin_api.json    # for the replay stub
+
+``GET /api/admin/dashboard`` and ``GET /api/admin/analytics`` are fetched
+concurrently over a small pool of keep-alive connections with an admin JWT
+(``API_TOKEN``, or a login with ``ADMIN_EMAIL``/``ADMIN_PASSWORD``). Every
+response is cached with its ETag and revalidated with ``If-None-Match``;
+when the API times out or is unreachable the last cached snapshot is used.
+
+Only the standard library is used, so listing slides stays cheap.
+"""
+
+import argparse
+import hashlib
+import http.client
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+DEFAULT_API = os.environ.get("API_BASE", "http://localhost:5001/api")
+DEFAULT_TIMEOUT = float(os.environ.get("API_TIMEOUT", "5"))
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "ngo-connect-deck", "api",
+)
+ENDPOINTS = {
+    "dashboard": "/admin/dashboard",
+    "analytics": "/admin/analytics",
+}
+
+# How each endpoint's data was obtained.
+FRESH, NOT_MODIFIED, CACHED = "fresh", "not-modified", "cached"
+
+Snapshot = namedtuple("Snapshot", "api dashboard analytics sources")
+
+# Network failures that fall back to the cached snapshot.
+_UNAVAILABLE = (OSError, http.client.HTTPException)
+# What a pooled connection the server already closed fails with.
+_STALE = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class ApiError(RuntimeError):
+    """The API answered, but not with something usable."""
+
+
+# ── Connection pool ─────────────────────────────────────────────
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections to one API, shared between threads."""
+
+    def __init__(self, base_url, size=4, timeout=DEFAULT_TIMEOUT):
+        url = urlsplit(base_url)
+        if url.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported API URL: {base_url!r}")
+        self.base_url = base_url.rstrip("/")
+        self.prefix = url.path.rstrip("/")
+        self.timeout = timeout
+        self._factory = (http.client.HTTPSConnection if url.scheme == "https"
+                         else http.client.HTTPConnection)
+        self._address = url.hostname, url.port
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def request(self, method, path, body=None, headers=None):
+        """Send one request; returns ``(status, headers, body_bytes)``.
+
+        A pooled connection the server has since closed is retried once on
+        a fresh connection.
+        """
+        with self._slots:
+            try:
+                conn, reused = self._idle.get_nowait(), True
+            except queue.Empty:
+                conn, reused = self._connect(), False
+            while True:
+                try:
+                    response = self._send(conn, method, path, body, headers)
+                except _STALE:
+                    conn.close()
+                    if not reused:
+                        raise
+                    conn, reused = self._connect(), False
+                    continue
+                except BaseException:
+                    conn.close()
+                    raise
+                # http.client reopens a connection the server closed, so
+                # every connection can go back to the pool.
+                self._idle.put(conn)
+                return response
+
+    def _connect(self):
+        host, port = self._address
+        return self._factory(host, port, timeout=self.timeout)
+
+    def _send(self, conn, method, path, body, headers):
+        conn.request(method, self.prefix + path, body=body, headers=headers or {})
+        resp = conn.getresponse()
+        return resp.status, resp.headers, resp.read()
+
+
+# ── Auth ────────────────────────────────────────────────────────
+def login(pool, email, password):
+    """Exchange admin credentials for a JWT via ``POST /auth/login``."""
+    payload = json.dumps({"email": email, "password": password}).encode("utf-8")
+    status, _, data = pool.request("POST", "/auth/login", payload,
+                                   {"Content-Type": "application/json"})
+    if status != 200:
+        raise ApiError(f"Login as {email} failed (HTTP {status})")
+    token = json.loads(data).get("token")
+    if not token:
+        raise ApiError("Login response has no token")
+    return token
+
+
+def resolve_token(pool, token=None):
+    token = token or os.environ.get("API_TOKEN")
+    if token:
+        return token
+    email, password = os.environ.get("ADMIN_EMAIL"), os.environ.get("ADMIN_PASSWORD")
+    if email and password:
+        return login(pool, email, password)
+    raise ApiError("No API credentials: set API_TOKEN, or ADMIN_EMAIL and ADMIN_PASSWORD")
+
+
+# ── Snapshot cache ──────────────────────────────────────────────
+def _cache_path(cache_dir, base_url, name):
+    key = hashlib.sha256(base_url.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{name}-{key}.json")
+
+
+def _read_cache(path):
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(path, entry):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(entry, fh)
+    os.replace(tmp, path)
+
+
+# ── Fetching ────────────────────────────────────────────────────
+def fetch_endpoint(pool, token, path, cache_path):
+    """GET *path*, revalidating the cached copy. Returns ``(body, source)``."""
+    cached = _read_cache(cache_path)
+    headers = {"Authorization": f"Bearer {token}", "Accept": "application/json"}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    status, resp_headers, data = pool.request("GET", path, headers=headers)
+    if status == 304 and cached:
+        return cached["body"], NOT_MODIFIED
+    if status != 200:
+        raise ApiError(f"GET {path} failed (HTTP {status})")
+
+    body = json.loads(data)
+    _write_cache(cache_path, {
+        "url": pool.base_url + path,
+        "etag": resp_headers.get("ETag"),
+        "fetched_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "body": body,
+    })
+    return body, FRESH
+
+
+def fetch_snapshot(api=None, token=None, timeout=DEFAULT_TIMEOUT, cache_dir=CACHE_DIR):
+    """Fetch every endpoint in :data:`ENDPOINTS` concurrently.
+
+    An endpoint that times out or cannot be reached is served from its
+    last cached response; :class:`ApiError` is raised only when there is
+    no cached copy to fall back to.
+    """
+    api = (api or DEFAULT_API).rstrip("/")
+    paths = {name: _cache_path(cache_dir, api, name) for name in ENDPOINTS}
+    results = {}
+
+    with ConnectionPool(api, size=len(ENDPOINTS), timeout=timeout) as pool:
+        try:
+            token = resolve_token(pool, token)
+            failure = None
+        except _UNAVAILABLE as exc:
+            failure = exc
+
+        if failure is None:
+            with ThreadPoolExecutor(max_workers=len(ENDPOINTS)) as executor:
+                futures = {
+                    name: executor.submit(fetch_endpoint, pool, token, path, paths[name])
+                    for name, path in ENDPOINTS.items()
+                }
+                for name, future in futures.items():
+                    try:
+                        results[name] = future.result()
+                    except _UNAVAILABLE as exc:
+                        failure = exc
+
+    for name in ENDPOINTS:
+        if name in results:
+            continue
+        cached = _read_cache(paths[name])
+        if cached is None:
+            raise ApiError(f"{api}{ENDPOINTS[name]} unavailable ({failure}) "
+                           "and no cached snapshot to fall back to")
+        results[name] = cached["body"], CACHED
+
+    return Snapshot(
+        api,
+        results["dashboard"][0],
+        results["analytics"][0],
+        {name: source for name, (_, source) in results.items()},
+    )
+
+
+# ── Active snapshot ─────────────────────────────────────────────
+_active = None
+
+
+def current():
+    """The snapshot the dashboard slide is being built from."""
+    if _active is None:
+        raise ApiError("No dashboard snapshot loaded")
+    return _active
+
+
+@contextmanager
+def use_snapshot(snapshot):
+    global _active
+    saved = _active
+    _active = snapshot
+    try:
+        yield snapshot
+    finally:
+        _active = saved
+
+
+def record(snapshot, path):
+    """Write *snapshot* as a recording :mod:`presentation.replay` can serve."""
+    prefix = urlsplit(snapshot.api).path.rstrip("/")
+    responses = {}
+    for name, endpoint in ENDPOINTS.items():
+        responses[f"GET {prefix}{endpoint}"] = {"status": 200, "body": getattr(snapshot, name)}
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(responses, fh, indent=2)
+        fh.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m presentation.dashboard",
+        description="Fetch the admin dashboard snapshot the deck's appendix shows.",
+    )
+    parser.add_argument("--api", default=DEFAULT_API, help=f"API base URL (default: {DEFAULT_API})")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="per-request timeout in seconds")
+    parser.add_argument("--record", default=None, metavar="FILE",
+                        help="save the responses as a replay recording")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        snapshot = fetch_snapshot(args.api, timeout=args.timeout)
+    except (ApiError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - started
+
+    print(f"{snapshot.api}  ({elapsed:.2f}s)")
+    for name, source in snapshot.sources.items():
+        print(f"  {ENDPOINTS[name]:<18} {source}")
+    stats = snapshot.dashboard.get("stats", {})
+    for key in ("usersTotal", "ngosTotal", "campaignsTotal", "donationsCompletedTotal",
+                "volunteerApplicationsCount", "flaggedTotal", "pendingNgos"):
+        print(f"  {key:<28} {stats.get(key, 0):,}")
+    if args.record:
+        record(snapshot, args.record)
+        print(f"Recorded responses to {args.record}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
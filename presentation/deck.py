@@ -0,0 +1,375 @@
+"""
+Slide catalogue and the build/render entry points.
+
+Nothing here imports python-pptx at module level, so listing or selecting
+slides stays cheap; the drawing modules are pulled in by
+:func:`build_presentation` only when a deck is actually produced.
+
+Multi-locale builds compile the deck once in template mode (every string
+replaced by its catalog key) and hand that template to one worker process
+per locale, which only substitutes text, swaps fonts and saves.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import warnings
+from collections import namedtuple
+from contextlib import contextmanager
+from io import BytesIO
+
+from . import i18n
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT = os.path.join(REPO_ROOT, "NGO_Connect_Architecture_Presentation.pptx")
+FORMATS = ("pptx", "pdf")
+
+SlideSpec = namedtuple("SlideSpec", "key title")
+
+# Deck order. Each key maps to ``presentation.slides.build_<key>``.
+SLIDES = (
+    SlideSpec("title", "Title"),
+    SlideSpec("agenda", "Agenda"),
+    SlideSpec("summary", "Executive Summary"),
+    SlideSpec("section_architecture", "Section: System Architecture"),
+    SlideSpec("architecture", "High-Level Architecture"),
+    SlideSpec("tech_stack", "Technology Stack"),
+    SlideSpec("roles", "User Roles & Access Control"),
+    SlideSpec("section_features", "Section: Core Feature Modules"),
+    SlideSpec("features", "Feature Modules Overview"),
+    SlideSpec("section_database", "Section: Database Design"),
+    SlideSpec("database", "Database Schema"),
+    SlideSpec("section_api", "Section: REST API Surface"),
+    SlideSpec("api_distribution", "API Endpoint Distribution"),
+    SlideSpec("api_highlights", "Key API Highlights"),
+    SlideSpec("section_workflows", "Section: Key Workflows"),
+    SlideSpec("workflows", "Donation & Volunteer Workflows"),
+    SlideSpec("section_ai", "Section: AI & Recommendation Engine"),
+    SlideSpec("ai_features", "AI & Intelligence Features"),
+    SlideSpec("data_fundraising", "Seed Data: Fundraising"),
+    SlideSpec("data_engagement", "Seed Data: Volunteers & Reach"),
+    SlideSpec("section_frontend", "Section: Frontend Application"),
+    SlideSpec("frontend_pages", "Frontend Page Architecture"),
+    SlideSpec("deployment", "Deployment & Configuration"),
+    SlideSpec("closing", "Thank You"),
+    SlideSpec("dashboard", "Appendix: Admin Dashboard Snapshot"),
+)
+
+class IndexWarning(UserWarning):
+    """The deck was saved but the search index could not be updated."""
+
+
+# Slides drawn from the running API (see presentation.dashboard). They are
+# left out of the default selection unless an API is given.
+LIVE_SLIDES = frozenset({"dashboard"})
+
+# Slides charting the seed-data fixture (see presentation.fixtures).
+FIXTURE_SLIDES = frozenset({"data_fundraising", "data_engagement"})
+
+
+def select_slides(selection=None, live=False):
+    """Resolve a selection to a list of :class:`SlideSpec` in deck order.
+
+    *selection* is ``None`` (whole deck, plus :data:`LIVE_SLIDES` if
+    *live*), a comma-separated string, or an iterable of tokens. A token is
+    a 1-based slide number, an inclusive range such as ``5-7``, or a slide
+    key such as ``api_distribution``. Selecting one of :data:`LIVE_SLIDES`
+    without *live* is an error.
+    """
+    if selection is None:
+        return [spec for spec in SLIDES if live or spec.key not in LIVE_SLIDES]
+    if isinstance(selection, str):
+        selection = selection.split(",")
+
+    by_key = {spec.key: i for i, spec in enumerate(SLIDES)}
+    picked = set()
+    for token in selection:
+        token = str(token).strip()
+        if not token:
+            continue
+        if token in by_key:
+            picked.add(by_key[token])
+            continue
+        lo, sep, hi = token.partition("-")
+        try:
+            first = int(lo)
+            last = int(hi) if sep else first
+        except ValueError:
+            raise ValueError(f"Unknown slide: {token!r}") from None
+        if not 1 <= first <= last <= len(SLIDES):
+            raise ValueError(f"Slide range out of bounds (1-{len(SLIDES)}): {token!r}")
+        picked.update(range(first - 1, last))
+
+    if not picked:
+        raise ValueError("Slide selection is empty")
+    specs = [SLIDES[i] for i in sorted(picked)]
+    if not live:
+        for number, spec in enumerate(SLIDES, 1):
+            if spec in specs and spec.key in LIVE_SLIDES:
+                raise ValueError(f"Slide {number} ({spec.key}) needs the backend API (--api URL)")
+    return specs
+
+
+def build_presentation(slides=None, locale=None, fixture=None, api=None):
+    """Build the deck in memory and return the ``pptx.Presentation``.
+
+    *slides* accepts anything :func:`select_slides` does; *locale* is a
+    catalog code such as ``"hi"`` (default: the active locale, English).
+    Other locales than English are built as a template and localized, as
+    :func:`render_locales` does, so a locale always renders the same.
+    *fixture* is the data the seed-data slides chart: ``backend/seed.js``
+    by default, or another seed file or saved ``.npz`` fixture.
+    *api* is the backend's base URL (``http://localhost:5001/api``); giving
+    one adds the admin dashboard appendix, fetched once for the build.
+    """
+    if fixture is not None:
+        specs = select_slides(slides, live=api is not None)
+        if not any(spec.key in FIXTURE_SLIDES for spec in specs):
+            return build_presentation(slides, locale=locale, api=api)
+        from . import fixtures
+
+        with fixtures.use_fixture(fixture):
+            return build_presentation(slides, locale=locale, api=api)
+    if locale is not None and locale != i18n.DEFAULT_LOCALE:
+        i18n.load_catalog(locale)  # fail before building
+        with i18n.use_locale(i18n.DEFAULT_LOCALE, template=True):
+            prs = build_presentation(slides, api=api)
+        localize(prs, locale)
+        return prs
+    if locale is not None:
+        with i18n.use_locale(locale):
+            return build_presentation(slides, api=api)
+
+    specs = select_slides(slides, live=api is not None)
+    if any(spec.key in LIVE_SLIDES for spec in specs):
+        from . import dashboard
+
+        with dashboard.use_snapshot(dashboard.fetch_snapshot(api)):
+            return _build(specs)
+    return _build(specs)
+
+
+def _build(specs):
+    from pptx import Presentation
+
+    from . import slides as builders
+    from .primitives import SLIDE_W, SLIDE_H
+
+    prs = Presentation()
+    prs.slide_width = SLIDE_W
+    prs.slide_height = SLIDE_H
+    blank = prs.slide_layouts[6]  # blank layout
+
+    for spec in specs:
+        sl = prs.slides.add_slide(blank)
+        getattr(builders, "build_" + spec.key)(sl)
+    return prs
+
+
+def render(output_path=DEFAULT_OUTPUT, slides=None, fmt=None, locale=None,
+           fixture=None, api=None, index=None):
+    """Build the deck and write it to *output_path*.
+
+    *fmt* defaults to the output file's extension. ``pdf`` is produced by
+    converting the pptx with a headless LibreOffice (``soffice``).
+    With *index* (a directory), the deck's text is added to that search
+    index (see :mod:`presentation.search`), replacing any earlier build
+    written to the same path; if that fails, an :class:`IndexWarning` is
+    issued instead of an error. Returns the number of slides written.
+    """
+    fmt = _resolve_format(output_path, fmt)
+    prs = build_presentation(slides, locale=locale, fixture=fixture, api=api)
+    _save(prs, output_path, fmt)
+    if index is not None:
+        from . import search
+
+        with _index_failures_warn(index):
+            search.update({output_path: search.deck_documents(prs)}, index)
+    return len(prs.slides)
+
+
+def render_locales(locales, output_path=DEFAULT_OUTPUT, slides=None, fmt=None,
+                   workers=None, fixture=None, api=None, index=None):
+    """Render one deck per locale in parallel from a single compiled layout.
+
+    *output_path* may contain ``{locale}``; otherwise ``_<code>`` is added
+    before the extension. *index* is as for :func:`render`; all locales
+    go into one index update. Returns ``{code: (path, slide_count)}``.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    fmt = _resolve_format(output_path, fmt)
+    for code in locales:
+        i18n.load_catalog(code)  # fail fast on unknown locales
+
+    with i18n.use_locale(i18n.DEFAULT_LOCALE, template=True):
+        template = build_presentation(slides, fixture=fixture, api=api)
+    buf = BytesIO()
+    template.save(buf)
+    blob = buf.getvalue()
+
+    paths = {code: locale_output_path(output_path, code) for code in locales}
+    workers = workers or min(len(locales), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            code: pool.submit(_render_locale, blob, code, path, fmt, index is not None)
+            for code, path in paths.items()
+        }
+        results = {code: future.result() for code, future in futures.items()}
+
+    if index is not None:
+        from . import search
+
+        with _index_failures_warn(index):
+            search.update({paths[code]: docs for code, (_, docs) in results.items()}, index)
+    return {code: (paths[code], count) for code, (count, _) in results.items()}
+
+
+@contextmanager
+def _index_failures_warn(index):
+    # The deck is already saved; a locked, unwritable or damaged index
+    # must not turn a successful build into a failed one.
+    try:
+        yield
+    except Exception as exc:
+        warnings.warn(f"search index {index} not updated: {exc}", IndexWarning, stacklevel=4)
+
+
+def locale_output_path(output_path, code):
+    if "{locale}" in output_path:
+        return output_path.format(locale=code)
+    root, ext = os.path.splitext(output_path)
+    return f"{root}_{code}{ext}"
+
+
+def _render_locale(blob, code, output_path, fmt, collect=False):
+    """Worker: localize and save one deck; returns ``(slides, documents)``."""
+    from pptx import Presentation
+
+    prs = Presentation(BytesIO(blob))
+    localize(prs, code)
+    _save(prs, output_path, fmt)
+    if not collect:
+        return len(prs.slides), None
+    from . import search
+
+    return len(prs.slides), search.deck_documents(prs)
+
+
+def localize(prs, code):
+    """Substitute template tokens in *prs* with locale *code*, in place.
+
+    Fonts set to the default locale's typeface are swapped for the
+    locale's. A paragraph whose translation needs more lines than the
+    English text it replaces is shrunk (to at most 70%) to keep the layout.
+    Chart labels are substituted in the chart part and its workbook.
+    """
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+    from pptx.oxml.ns import qn
+    from pptx.util import Pt
+
+    base = i18n.load_catalog(i18n.DEFAULT_LOCALE)
+    catalog = i18n.load_catalog(code)
+    base_metrics = i18n.metrics_for(base.code)
+    metrics = i18n.metrics_for(code)
+
+    for slide in prs.slides:
+        for shape in slide.shapes:
+            if not shape.has_text_frame:
+                continue
+            tf = shape.text_frame
+            box = shape.width - (tf.margin_left + tf.margin_right)
+            for p in tf.paragraphs:
+                text = p.text
+                if i18n.TOKEN_OPEN not in text:
+                    continue
+                source = base.substitute(text)
+                localized = catalog.substitute(text)
+                p.text = localized
+                size = p.font.size
+                if size is None or localized == source:
+                    continue
+                target = base_metrics.lines(source, size.pt, box)
+                pt = size.pt
+                while pt > size.pt * 0.7 and metrics.lines(localized, pt, box) > target:
+                    pt -= 1
+                if pt != size.pt:
+                    p.font.size = Pt(pt)
+
+        # Chart text lives in the chart parts, not the slide XML.
+        charts = [rel.target_part for rel in slide.part.rels.values()
+                  if rel.reltype == RT.CHART]
+        for chart in charts:
+            _localize_chart(chart, catalog)
+
+        if catalog.font == base.font and not catalog.cs_font:
+            continue
+        for element in (slide._element, *(chart._element for chart in charts)):
+            for latin in element.iter(qn("a:latin")):
+                if latin.get("typeface") != base.font:
+                    continue
+                latin.set("typeface", catalog.font)
+                if catalog.cs_font and latin.getparent().find(qn("a:cs")) is None:
+                    latin.addnext(latin.makeelement(qn("a:cs"), {"typeface": catalog.cs_font}))
+
+
+def _localize_chart(part, catalog):
+    from pptx.oxml.ns import qn
+
+    changed = False
+    for el in part._element.iter(qn("c:v"), qn("a:t")):
+        if el.text and i18n.TOKEN_OPEN in el.text:
+            el.text = catalog.substitute(el.text)
+            changed = True
+    workbook = part.chart_workbook
+    if changed and workbook.xlsx_part is not None:
+        workbook.update_from_xlsx_blob(_localize_workbook(workbook.xlsx_part.blob, catalog))
+
+
+def _localize_workbook(blob, catalog):
+    """*blob* (a chart's xlsx) with the template tokens in its XML substituted."""
+    import re
+    import zipfile
+    from xml.sax.saxutils import escape
+
+    token = re.compile(f"{i18n.TOKEN_OPEN}([^{i18n.TOKEN_CLOSE}]*){i18n.TOKEN_CLOSE}")
+    out = BytesIO()
+    with zipfile.ZipFile(BytesIO(blob)) as src, \
+            zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            data = src.read(info)
+            if info.filename.endswith(".xml"):
+                text = token.sub(lambda m: escape(catalog.get(m.group(1))), data.decode("utf-8"))
+                data = text.encode("utf-8")
+            dst.writestr(info, data)
+    return out.getvalue()
+
+
+def _resolve_format(output_path, fmt):
+    fmt = (fmt or os.path.splitext(output_path)[1].lstrip(".") or "pptx").lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    return fmt
+
+
+def _save(prs, output_path, fmt):
+    if fmt == "pptx":
+        prs.save(output_path)
+    else:
+        _save_pdf(prs, output_path)
+
+
+def _save_pdf(prs, output_path):
+    soffice = shutil.which("soffice") or shutil.which("libreoffice")
+    if soffice is None:
+        raise RuntimeError("PDF output needs LibreOffice ('soffice') on PATH")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "deck.pptx")
+        prs.save(src)
+        subprocess.run(
+            [soffice, "--headless", "--convert-to", "pdf", "--outdir", tmp, src],
+            check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        )
+        shutil.move(os.path.join(tmp, "deck.pdf"), output_path)
@@ -0,0 +1,569 @@
+"""
+Semantic diff of two generated decks.
+
+    python -m presentation.diff old.pptx new.pptx
+    python -m presentation.diff old.pptx new.pptx --json -o diff.json
+
+Each shape gets a stable signature from its type, geometry, text and fill
+colour, plus, for a chart, the categories, values and point colours in its
+chart part; a slide's signature is the hash of its shape signatures. Slides
+are aligned by signature rather than position, so inserting one slide
+reports one added slide instead of every later slide as modified.
+
+Decks are read straight from the package XML (no python-pptx object
+model), and alignment uses hash lookups plus one longest-increasing-
+subsequence pass, so the cost is linear in shape count up to that
+O(n log n) step.
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+import posixpath
+import sys
+import zipfile
+from collections import defaultdict, deque, namedtuple
+
+from lxml import etree
+
+NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "c": "http://schemas.openxmlformats.org/drawingml/2006/chart",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+_CHART_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/chart"
+
+
+def _tag(prefix, name):
+    return "{%s}%s" % (NS[prefix], name)
+
+
+_SHAPE_TAGS = {_tag("p", name) for name in ("sp", "pic", "graphicFrame", "cxnSp")}
+_GROUP = _tag("p", "grpSp")
+_NV_TAGS = {_tag("p", name) for name in
+            ("nvSpPr", "nvPicPr", "nvGraphicFramePr", "nvCxnSpPr")}
+_P_CNVPR, _P_SPPR, _P_XFRM, _P_TXBODY = (
+    _tag("p", "cNvPr"), _tag("p", "spPr"), _tag("p", "xfrm"), _tag("p", "txBody"))
+_A_XFRM, _A_OFF, _A_EXT, _A_PRSTGEOM, _A_SOLIDFILL = (
+    _tag("a", "xfrm"), _tag("a", "off"), _tag("a", "ext"),
+    _tag("a", "prstGeom"), _tag("a", "solidFill"))
+_A_GRAPHIC, _A_GRAPHICDATA, _A_P, _A_T = (
+    _tag("a", "graphic"), _tag("a", "graphicData"), _tag("a", "p"), _tag("a", "t"))
+_C_CHART, _C_SER, _C_TX, _C_CAT, _C_VAL, _C_PT, _C_V, _C_DPT, _C_IDX, _C_SPPR = (
+    _tag("c", name) for name in
+    ("chart", "ser", "tx", "cat", "val", "pt", "v", "dPt", "idx", "spPr"))
+_R_ID = _tag("r", "id")
+
+Shape = namedtuple("Shape", "id name kind geometry text fill chart sig")
+Slide = namedtuple("Slide", "number shapes sig")
+Chart = namedtuple("Chart", "categories series")
+Series = namedtuple("Series", "name values fills")
+
+
+def _digest(*parts):
+    data = "".join(f"{part}\0" for part in parts).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+# ── Loading ─────────────────────────────────────────────────────
+def load_deck(path):
+    """Read *path* into a list of :class:`Slide` in presentation order."""
+    with zipfile.ZipFile(path) as zf:
+        slides = []
+        for number, part in enumerate(_slide_parts(zf), 1):
+            root = etree.fromstring(zf.read(part))
+            tree = root.find("p:cSld/p:spTree", NS)
+            charts = _chart_reader(zf, part)
+            shapes = [_shape(el, charts) for el in _iter_shapes(tree)] if tree is not None else []
+            slides.append(Slide(number, shapes, _digest(*(s.sig for s in shapes))))
+    return slides
+
+
+def _part_rels(zf, part):
+    """``{rId: (reltype, part name)}`` for the internal rels of *part*."""
+    folder, name = posixpath.split(part)
+    try:
+        rels = etree.fromstring(zf.read(posixpath.join(folder, "_rels", name + ".rels")))
+    except KeyError:
+        return {}
+    return {
+        rel.get("Id"): (rel.get("Type"),
+                        posixpath.normpath(posixpath.join(folder, rel.get("Target"))))
+        for rel in rels.iterfind("rel:Relationship", NS)
+        if rel.get("TargetMode") != "External"
+    }
+
+
+def _slide_parts(zf):
+    rels = _part_rels(zf, "ppt/presentation.xml")
+    prs = etree.fromstring(zf.read("ppt/presentation.xml"))
+    return [
+        rels[sld.get(_R_ID)][1]
+        for sld in prs.iterfind("p:sldIdLst/p:sldId", NS)
+    ]
+
+
+def _chart_reader(zf, part):
+    """``rId -> Chart`` for the charts *part* (a slide) links to."""
+    rels = {}
+
+    def read(rid):
+        if not rels:  # most slides have no chart; read their rels on demand
+            rels.update(_part_rels(zf, part))
+        reltype, target = rels.get(rid, (None, None))
+        if reltype != _CHART_REL:
+            return None
+        return read_chart(etree.fromstring(zf.read(target)))
+
+    return read
+
+
+def read_chart(space):
+    """:class:`Chart` from a ``c:chartSpace`` element.
+
+    Categories come from the first series; each series keeps its cached
+    values and one fill colour per point (``None`` where it has none).
+    """
+    categories, series = (), []
+    for ser in space.iter(_C_SER):
+        name, cat, values, default, fills = "", None, {}, None, {}
+        for child in ser:
+            if child.tag == _C_TX:
+                name = "".join(v.text or "" for v in child.iter(_C_V))
+            elif child.tag == _C_CAT:
+                cat = child
+            elif child.tag == _C_VAL:
+                values = _points(child)
+            elif child.tag == _C_SPPR:
+                default = _solid_fill(child)
+            elif child.tag == _C_DPT:
+                idx, spPr = child.find(_C_IDX), child.find(_C_SPPR)
+                if idx is not None and spPr is not None:
+                    fills[int(idx.get("val"))] = _solid_fill(spPr)
+        if not series and cat is not None:
+            labels = _points(cat)
+            categories = tuple(labels.get(i, "") for i in range(max(labels, default=-1) + 1))
+        count = max(len(categories), max(values, default=-1) + 1)
+        series.append(Series(
+            name,
+            tuple(values.get(i) for i in range(count)),
+            tuple(fills.get(i, default) for i in range(count)),
+        ))
+    return Chart(categories, tuple(series))
+
+
+def _points(ref):
+    """``{idx: text}`` of the cached points under a ``c:cat``/``c:val``."""
+    out = {}
+    for pt in ref.iter(_C_PT):
+        v = pt.find(_C_V)
+        out[int(pt.get("idx"))] = v.text if v is not None else ""
+    return out
+
+
+def _solid_fill(spPr):
+    fill = spPr.find(_A_SOLIDFILL)
+    return fill[0].get("val") if fill is not None and len(fill) else None
+
+
+def _iter_shapes(tree):
+    for el in tree:
+        if el.tag == _GROUP:
+            yield from _iter_shapes(el)
+        elif el.tag in _SHAPE_TAGS:
+            yield el
+
+
+def _shape(el, charts=None):
+    """:class:`Shape` for a shape element; *charts* maps a chart rId to a Chart.
+
+    Each child of *el* is visited once; this runs for every shape of both
+    decks, so it avoids repeated descendant searches.
+    """
+    kind = el.tag.rpartition("}")[2]
+    shape_id, name, geometry, fill, chart = 0, "", None, None, None
+    paragraphs = ()
+    for child in el:
+        tag = child.tag
+        if tag in _NV_TAGS:
+            cNvPr = child.find(_P_CNVPR)
+            if cNvPr is not None:
+                shape_id, name = int(cNvPr.get("id", 0)), cNvPr.get("name", "")
+        elif tag == _P_SPPR:
+            for prop in child:
+                if prop.tag == _A_XFRM:
+                    geometry = _geometry(prop)
+                elif prop.tag == _A_PRSTGEOM:
+                    kind = f"{kind}:{prop.get('prst')}"
+                elif prop.tag == _A_SOLIDFILL and len(prop):
+                    fill = prop[0].get("val")
+        elif tag == _P_XFRM:
+            geometry = _geometry(child)
+        elif tag == _P_TXBODY:
+            paragraphs = child.iterchildren(_A_P)
+        elif tag == _A_GRAPHIC:
+            data = child.find(_A_GRAPHICDATA)
+            if data is None:
+                continue
+            kind = f"{kind}:{data.get('uri', '').rsplit('/', 1)[-1]}"
+            paragraphs = data.iter(_A_P)
+            ref = data.find(_C_CHART)
+            if ref is not None and charts is not None:
+                chart = charts(ref.get(_R_ID))
+
+    text = "\n".join("".join(t.text or "" for t in p.iter(_A_T)) for p in paragraphs)
+    return Shape(shape_id, name, kind, geometry, text, fill, chart,
+                 _digest(kind, geometry, text, fill, chart))
+
+
+def _geometry(xfrm):
+    off, ext = xfrm.find(_A_OFF), xfrm.find(_A_EXT)
+    if off is None or ext is None:
+        return None
+    return (int(off.get("x")), int(off.get("y")), int(ext.get("cx")), int(ext.get("cy")))
+
+
+# ── Alignment ───────────────────────────────────────────────────
+def align(old, new, key=lambda item: item.sig):
+    """Pair items of *old* and *new* by signature, keeping relative order.
+
+    Returns ``(pairs, removed, added)`` where *pairs* are ``(i, j)`` index
+    pairs of identical items in increasing order of both indices. Items
+    whose signature is unique in both lists anchor the alignment (the
+    patience-diff idea); gaps between anchors are then matched greedily.
+    """
+    old_keys = [key(x) for x in old]
+    new_keys = [key(x) for x in new]
+    old_count = defaultdict(int)
+    new_pos = defaultdict(list)
+    for k in old_keys:
+        old_count[k] += 1
+    for j, k in enumerate(new_keys):
+        new_pos[k].append(j)
+
+    candidates = [
+        (i, new_pos[k][0]) for i, k in enumerate(old_keys)
+        if old_count[k] == 1 and len(new_pos[k]) == 1
+    ]
+    anchors = _increasing(candidates)
+
+    pairs = []
+    prev_i = prev_j = -1
+    for i, j in anchors + [(len(old), len(new))]:
+        pairs.extend(_match_gap(old_keys, new_keys, prev_i + 1, i, prev_j + 1, j))
+        if i < len(old):
+            pairs.append((i, j))
+        prev_i, prev_j = i, j
+
+    matched_old = {i for i, _ in pairs}
+    matched_new = {j for _, j in pairs}
+    removed = [i for i in range(len(old)) if i not in matched_old]
+    added = [j for j in range(len(new)) if j not in matched_new]
+    return pairs, removed, added
+
+
+def _increasing(pairs):
+    """Longest subsequence of *pairs* (sorted by i) with increasing j."""
+    tails, tails_idx, parent = [], [], [None] * len(pairs)
+    for n, (_, j) in enumerate(pairs):
+        pos = bisect.bisect_left(tails, j)
+        if pos == len(tails):
+            tails.append(j)
+            tails_idx.append(n)
+        else:
+            tails[pos] = j
+            tails_idx[pos] = n
+        parent[n] = tails_idx[pos - 1] if pos else None
+    out = []
+    n = tails_idx[-1] if tails_idx else None
+    while n is not None:
+        out.append(pairs[n])
+        n = parent[n]
+    return out[::-1]
+
+
+def _match_gap(old_keys, new_keys, i0, i1, j0, j1):
+    waiting = defaultdict(deque)
+    for j in range(j0, j1):
+        waiting[new_keys[j]].append(j)
+    pairs = []
+    last_j = j0 - 1
+    for i in range(i0, i1):
+        queue = waiting.get(old_keys[i])
+        while queue and queue[0] <= last_j:
+            queue.popleft()
+        if queue:
+            last_j = queue.popleft()
+            pairs.append((i, last_j))
+    return pairs
+
+
+def _pair_leftovers(old, new, removed, added, keys):
+    """Pair unmatched items that agree on one of *keys*, in order."""
+    pairs = []
+    for key in keys:
+        waiting = defaultdict(deque)
+        for j in added:
+            waiting[key(new[j])].append(j)
+        still_removed = []
+        for i in removed:
+            queue = waiting.get(key(old[i]))
+            if queue:
+                pairs.append((i, queue.popleft()))
+            else:
+                still_removed.append(i)
+        taken = {j for _, j in pairs}
+        removed = still_removed
+        added = [j for j in added if j not in taken]
+    return pairs, removed, added
+
+
+# ── Diff ────────────────────────────────────────────────────────
+def _slide_title(slide):
+    for shape in slide.shapes:
+        line = shape.text.strip().split("\n", 1)[0]
+        if line:
+            return line
+    return ""
+
+
+def _shape_json(shape):
+    return {
+        "name": shape.name,
+        "type": shape.kind,
+        "geometry": list(shape.geometry) if shape.geometry else None,
+        "text": shape.text,
+        "fill": shape.fill,
+        "chart": _chart_json(shape.chart) if shape.chart else None,
+    }
+
+
+def _chart_json(chart):
+    return {
+        "categories": list(chart.categories),
+        "series": [
+            {"name": ser.name, "values": list(ser.values), "fills": list(ser.fills)}
+            for ser in chart.series
+        ],
+    }
+
+
+def diff_shapes(old_shapes, new_shapes):
+    pairs, removed, added = align(old_shapes, new_shapes)
+    modified, removed, added = _pair_leftovers(
+        old_shapes, new_shapes, removed, added,
+        keys=(
+            lambda s: (s.kind, s.geometry),
+            lambda s: (s.kind, s.text),
+            lambda s: (s.kind, s.name),
+        ),
+    )
+    changes = []
+    for i, j in sorted(modified):
+        a, b = old_shapes[i], new_shapes[j]
+        fields = [f for f in ("kind", "geometry", "text", "fill", "chart")
+                  if getattr(a, f) != getattr(b, f)]
+        changes.append({
+            "changes": ["type" if f == "kind" else f for f in fields],
+            "old": _shape_json(a),
+            "new": _shape_json(b),
+        })
+    return {
+        "added": [_shape_json(new_shapes[j]) for j in added],
+        "removed": [_shape_json(old_shapes[i]) for i in removed],
+        "modified": changes,
+    }
+
+
+def diff_decks(old, new):
+    """Compare two loaded decks; returns a JSON-serialisable dict."""
+    pairs, removed, added = align(old, new)
+
+    # A slide present in both decks at crossing positions is a move.
+    moved, removed, added = _pair_leftovers(old, new, removed, added,
+                                            keys=(lambda s: s.sig,))
+    # Remaining slides in the same gap are edits of each other.
+    modified, removed, added = _pair_gaps(pairs, removed, added)
+
+    entries = []
+    for i, j in moved:
+        entries.append({"status": "moved", "old": old[i].number, "new": new[j].number,
+                        "title": _slide_title(new[j])})
+    for i, j in modified:
+        entries.append({"status": "modified", "old": old[i].number, "new": new[j].number,
+                        "title": _slide_title(new[j]),
+                        "shapes": diff_shapes(old[i].shapes, new[j].shapes)})
+    for i in removed:
+        entries.append({"status": "removed", "old": old[i].number, "new": None,
+                        "title": _slide_title(old[i])})
+    for j in added:
+        entries.append({"status": "added", "old": None, "new": new[j].number,
+                        "title": _slide_title(new[j])})
+    entries.sort(key=lambda e: (e["new"] if e["new"] is not None else e["old"],
+                                e["status"] != "removed"))
+
+    return {
+        "summary": {
+            "slides_old": len(old),
+            "slides_new": len(new),
+            "unchanged": len(pairs),
+            "moved": len(moved),
+            "modified": len(modified),
+            "added": len(added),
+            "removed": len(removed),
+        },
+        "slides": entries,
+    }
+
+
+def _pair_gaps(anchors, removed, added):
+    """Pair removed/added slides that sit between the same matched slides."""
+    anchors = sorted(anchors)
+    anchor_old = [i for i, _ in anchors]
+    anchor_new = [j for _, j in anchors]
+
+    by_gap = defaultdict(lambda: ([], []))
+    for i in removed:
+        by_gap[bisect.bisect_left(anchor_old, i)][0].append(i)
+    for j in added:
+        by_gap[bisect.bisect_left(anchor_new, j)][1].append(j)
+
+    pairs, still_removed, still_added = [], [], []
+    for olds, news in by_gap.values():
+        n = min(len(olds), len(news))
+        pairs.extend(zip(olds[:n], news[:n]))
+        still_removed.extend(olds[n:])
+        still_added.extend(news[n:])
+    return pairs, sorted(still_removed), sorted(still_added)
+
+
+# ── Report ──────────────────────────────────────────────────────
+def format_report(result, old_path, new_path):
+    s = result["summary"]
+    lines = [
+        f"--- {old_path} ({s['slides_old']} slides)",
+        f"+++ {new_path} ({s['slides_new']} slides)",
+        f"{s['unchanged']} unchanged, {s['modified']} modified, {s['moved']} moved, "
+        f"{s['added']} added, {s['removed']} removed",
+    ]
+    for entry in result["slides"]:
+        status = entry["status"]
+        where = {
+            "added": f"+ slide {entry['new']}",
+            "removed": f"- slide {entry['old']}",
+            "moved": f"> slide {entry['old']} -> {entry['new']}",
+            "modified": f"~ slide {entry['old']} -> {entry['new']}"
+            if entry["old"] != entry["new"] else f"~ slide {entry['new']}",
+        }[status]
+        lines.append("")
+        lines.append(f"{where}  {entry['title']}")
+        if status != "modified":
+            continue
+        shapes = entry["shapes"]
+        for shape in shapes["removed"]:
+            lines.append(f"    - {_describe(shape)}")
+        for shape in shapes["added"]:
+            lines.append(f"    + {_describe(shape)}")
+        for change in shapes["modified"]:
+            a, b = change["old"], change["new"]
+            lines.append(f"    ~ {b['type']} {b['name']!r} ({', '.join(change['changes'])})")
+            if "text" in change["changes"]:
+                lines.append(f"        - {_clip(a['text'])}")
+                lines.append(f"        + {_clip(b['text'])}")
+            if "fill" in change["changes"]:
+                lines.append(f"        fill {a['fill']} -> {b['fill']}")
+            if "geometry" in change["changes"]:
+                lines.append(f"        geometry {a['geometry']} -> {b['geometry']}")
+            if "chart" in change["changes"]:
+                lines.extend(f"        {line}" for line in _chart_changes(a["chart"], b["chart"]))
+    return "\n".join(lines)
+
+
+def _chart_changes(old, new, limit=12):
+    """Readable lines for what differs between two chart JSON dicts."""
+    empty = {"categories": [], "series": []}
+    old, new = old or empty, new or empty
+    lines = []
+    gone = [c for c in old["categories"] if c not in new["categories"]]
+    came = [c for c in new["categories"] if c not in old["categories"]]
+    if gone:
+        lines.append(f"categories - {_clip(', '.join(gone))}")
+    if came:
+        lines.append(f"categories + {_clip(', '.join(came))}")
+    if not gone and not came and old["categories"] != new["categories"]:
+        lines.append("categories reordered")
+
+    for n in range(max(len(old["series"]), len(new["series"]))):
+        if n >= len(old["series"]) or n >= len(new["series"]):
+            ser = (new["series"] + old["series"])[n]
+            sign = "+" if n >= len(old["series"]) else "-"
+            lines.append(f"series {sign} {ser['name']!r}")
+            continue
+        a, b = old["series"][n], new["series"][n]
+        if a["name"] != b["name"]:
+            lines.append(f"series {a['name']!r} -> {b['name']!r}")
+        before = _by_category(old["categories"], a)
+        after = _by_category(new["categories"], b)
+        for label in (c for c in new["categories"] if c in before):
+            (v0, f0), (v1, f1) = before[label], after[label]
+            if v0 != v1:
+                lines.append(f"{b['name']}: {label} {v0} -> {v1}")
+            if f0 != f1:
+                lines.append(f"{b['name']}: {label} fill {f0} -> {f1}")
+
+    if len(lines) > limit:
+        lines[limit:] = [f"… {len(lines) - limit} more"]
+    return lines
+
+
+def _by_category(categories, series):
+    return {
+        label: (series["values"][i] if i < len(series["values"]) else None,
+                series["fills"][i] if i < len(series["fills"]) else None)
+        for i, label in enumerate(categories)
+    }
+
+
+def _describe(shape):
+    label = f"{shape['type']} {shape['name']!r}"
+    return f"{label}: {_clip(shape['text'])}" if shape["text"] else label
+
+
+def _clip(text, width=80):
+    text = text.replace("\n", " / ")
+    return text if len(text) <= width else text[:width - 1] + "…"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m presentation.diff",
+        description="Compare two .pptx decks slide by slide and shape by shape.",
+    )
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--json", action="store_true", help="emit machine-readable JSON")
+    parser.add_argument("-o", "--output", default=None, help="write the report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    result = diff_decks(load_deck(args.old), load_deck(args.new))
+    if args.json:
+        report = json.dumps({"old": args.old, "new": args.new, **result},
+                            ensure_ascii=False, indent=2)
+    else:
+        report = format_report(result, args.old, args.new)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            fh.write(report + "\n")
+    else:
+        print(report)
+
+    s = result["summary"]
+    return 0 if s["unchanged"] == s["slides_old"] == s["slides_new"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
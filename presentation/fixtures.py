@@ -0,0 +1,402 @@
+"""
+Seed-data fixtures as columnar arrays, and the aggregates the data slides
+chart.
+
+    python -m presentation.fixtures                        # backend/seed.js
+    python -m presentation.fixtures --synthetic 1000000 -o load.npz
+    python -m presentation.fixtures --fixture load.npz
+
+``backend/seed.js`` is read without Node: the ``ngoSeeds``,
+``campaignSeeds``, ``sampleUsers`` and ``categoryNames`` literals are
+parsed directly and flattened into NumPy columns, with string columns
+dictionary-encoded. Every aggregate is a ``bincount``/mask over those
+columns, so the same code handles the ~40-row seed and million-row
+synthetic fixtures saved as ``.npz``.
+
+Aggregates are cached on disk keyed by the fixture file's SHA-256.
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEED_PATH = os.path.join(REPO_ROOT, "backend", "seed.js")
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "ngo-connect-deck",
+)
+# Bump when the columns or aggregates change shape.
+CACHE_VERSION = 1
+
+_SEED_LITERALS = ("ngoSeeds", "campaignSeeds", "sampleUsers", "categoryNames")
+
+
+# ── seed.js literal parser ──────────────────────────────────────
+class _JsLiteralParser:
+    """Just enough of JavaScript to read the seed data literals.
+
+    Handles objects, arrays, strings (template literals without
+    interpolation), numbers, booleans/null and the two helper calls the
+    seed file uses; other identifiers evaluate to ``None``.
+    """
+
+    _token = re.compile(r"""
+        \s+|//[^\n]*|/\*.*?\*/                          # skipped
+        |(?P<str>'(?:\\.|[^'\\])*'|"(?:\\.|[^"\\])*"|`(?:\\.|[^`\\])*`)
+        |(?P<num>-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)
+        |(?P<name>[A-Za-z_$][\w$]*)
+        |(?P<punct>\.\.\.|[{}\[\](),:])
+    """, re.S | re.X)
+
+    def __init__(self, source, pos):
+        self.source = source
+        self.pos = pos
+
+    def next(self):
+        while True:
+            m = self._token.match(self.source, self.pos)
+            if m is None:
+                raise ValueError(f"Unexpected input at offset {self.pos}")
+            self.pos = m.end()
+            if m.lastgroup:
+                return m.lastgroup, m.group(m.lastgroup)
+
+    def peek(self):
+        pos = self.pos
+        token = self.next()
+        self.pos = pos
+        return token
+
+    def value(self):
+        kind, text = self.next()
+        if kind == "str":
+            return _unescape(text[1:-1])
+        if kind == "num":
+            return float(text) if any(c in text for c in ".eE") else int(text)
+        if kind == "punct" and text == "{":
+            return self._object()
+        if kind == "punct" and text == "[":
+            return self._array()
+        if kind == "name":
+            if text in ("true", "false"):
+                return text == "true"
+            if text in ("null", "undefined"):
+                return None
+            if self.peek() == ("punct", "("):
+                self.next()
+                return _call(text, self._args())
+            return None
+        raise ValueError(f"Unexpected {text!r} at offset {self.pos}")
+
+    def _object(self):
+        out = {}
+        while True:
+            kind, text = self.next()
+            if text == "}":
+                return out
+            if text == ",":
+                continue
+            key = _unescape(text[1:-1]) if kind == "str" else text
+            self.next()  # ':'
+            out[key] = self.value()
+
+    def _array(self):
+        out = []
+        while True:
+            if self.peek() == ("punct", "]"):
+                self.next()
+                return out
+            out.append(self.value())
+            if self.next()[1] == "]":
+                return out
+
+    def _args(self):
+        args = []
+        while self.peek() != ("punct", ")"):
+            args.append(self.value())
+            if self.peek() == ("punct", ","):
+                self.next()
+        self.next()
+        return args
+
+
+def _unescape(text):
+    return re.sub(r"\\(.)", r"\1", text)
+
+
+def _call(name, args):
+    if name == "buildFinancials" and args and isinstance(args[0], dict):
+        # Mirrors buildFinancials() in backend/seed.js.
+        base_income, base_expense = args[0]["baseIncome"], args[0]["baseExpense"]
+        years = [2021, 2022, 2023, 2024, 2025]
+        return {
+            "years": years,
+            "income": [round(base_income * (1 + i * 0.08)) for i in range(len(years))],
+            "expenses": [round(base_expense * (1 + i * 0.075)) for i in range(len(years))],
+        }
+    if name == "imageUrl" and args:
+        return f"https://picsum.photos/seed/{args[0]}"
+    return None
+
+
+def parse_seed_literals(source, names=_SEED_LITERALS):
+    """Return ``{name: value}`` for each ``const <name> = <literal>`` found."""
+    out = {}
+    for name in names:
+        m = re.search(r"\bconst\s+%s\s*=\s*" % re.escape(name), source)
+        if m is not None:
+            out[name] = _JsLiteralParser(source, m.end()).value()
+    return out
+
+
+# ── Columnar fixtures ───────────────────────────────────────────
+def _encode(values):
+    """Dictionary-encode *values*: (int32 codes, label array)."""
+    labels, codes = np.unique(np.asarray(values, dtype=str), return_inverse=True)
+    return codes.astype(np.int32), labels
+
+
+def seed_fixture(path=SEED_PATH):
+    """Columnar fixture from ``backend/seed.js``.
+
+    Returns a flat dict of arrays: ``ngo.*`` and ``campaign.*`` columns
+    plus ``labels.*`` arrays for every dictionary-encoded column.
+    """
+    with open(path, encoding="utf-8") as fh:
+        data = parse_seed_literals(fh.read())
+    ngos = data.get("ngoSeeds") or []
+    campaigns = data.get("campaignSeeds") or []
+
+    slug_index = {ngo["slug"]: i for i, ngo in enumerate(ngos)}
+    ngo_district, district_labels = _encode(
+        [(ngo.get("addressDetails") or {}).get("district", "Unknown") for ngo in ngos])
+    category, category_labels = _encode([c.get("category") or "Other" for c in campaigns])
+    area, area_labels = _encode([c.get("area") or "Unknown" for c in campaigns])
+
+    def column(rows, get, dtype=np.float64):
+        return np.fromiter((get(row) or 0 for row in rows), dtype=dtype, count=len(rows))
+
+    return {
+        "ngo.district": ngo_district,
+        "ngo.strength": column(ngos, lambda n: n.get("orgStrength"), np.int32),
+        "ngo.income": column(ngos, lambda n: ((n.get("financials") or {}).get("income") or [0])[-1]),
+        "ngo.lng": column(ngos, lambda n: (n.get("location") or {}).get("coordinates", [0, 0])[0]),
+        "ngo.lat": column(ngos, lambda n: (n.get("location") or {}).get("coordinates", [0, 0])[1]),
+        "campaign.ngo": column(campaigns, lambda c: slug_index.get(c.get("ngoSlug"), -1), np.int32),
+        "campaign.category": category,
+        "campaign.area": area,
+        "campaign.goal": column(campaigns, lambda c: c.get("goalAmount")),
+        "campaign.raised": column(campaigns, lambda c: c.get("currentAmount")),
+        "campaign.volunteers": column(
+            campaigns, lambda c: (c.get("beneficiaryStats") or {}).get("volunteersEngaged"), np.int32),
+        "campaign.target": column(campaigns, lambda c: (c.get("beneficiaryStats") or {}).get("target")),
+        "campaign.reached": column(campaigns, lambda c: (c.get("beneficiaryStats") or {}).get("reached")),
+        "labels.ngo": np.asarray([ngo.get("name", ngo["slug"]) for ngo in ngos], dtype=str),
+        "labels.district": district_labels,
+        "labels.category": category_labels,
+        "labels.area": area_labels,
+        "labels.user_location": np.asarray(
+            [u.get("location", "") for u in data.get("sampleUsers") or []], dtype=str),
+    }
+
+
+def synthetic_fixture(campaigns=1_000_000, ngos=2_000, seed=0):
+    """Random fixture with the same columns as :func:`seed_fixture`."""
+    rng = np.random.default_rng(seed)
+    base = seed_fixture()
+    districts = base["labels.district"]
+    categories = base["labels.category"]
+    areas = base["labels.area"]
+
+    goal = rng.choice([0.0, 250_000.0, 500_000.0, 1_000_000.0, 2_500_000.0], size=campaigns)
+    return {
+        "ngo.district": rng.integers(0, len(districts), ngos, dtype=np.int32),
+        "ngo.strength": rng.integers(5, 500, ngos, dtype=np.int32),
+        "ngo.income": rng.lognormal(16, 1, ngos),
+        "ngo.lng": rng.uniform(74.0, 78.6, ngos),
+        "ngo.lat": rng.uniform(11.5, 18.5, ngos),
+        "campaign.ngo": rng.integers(0, ngos, campaigns, dtype=np.int32),
+        "campaign.category": rng.integers(0, len(categories), campaigns, dtype=np.int32),
+        "campaign.area": rng.integers(0, len(areas), campaigns, dtype=np.int32),
+        "campaign.goal": goal,
+        "campaign.raised": np.floor(goal * rng.beta(2, 2.5, campaigns)),
+        "campaign.volunteers": rng.poisson(40, campaigns).astype(np.int32),
+        "campaign.target": rng.integers(50, 10_000, campaigns).astype(np.float64),
+        "campaign.reached": rng.integers(0, 5_000, campaigns).astype(np.float64),
+        "labels.ngo": np.asarray([f"Synthetic NGO {i}" for i in range(ngos)], dtype=str),
+        "labels.district": districts,
+        "labels.category": categories,
+        "labels.area": areas,
+        "labels.user_location": base["labels.user_location"],
+    }
+
+
+def load_fixture(path=SEED_PATH):
+    """Load a ``.js`` seed file or a saved ``.npz`` fixture."""
+    if path.endswith(".npz"):
+        with np.load(path) as npz:
+            return {key: npz[key] for key in npz.files}
+    return seed_fixture(path)
+
+
+def save_fixture(fixture, path):
+    np.savez(path, **fixture)
+
+
+# ── Aggregates ──────────────────────────────────────────────────
+def aggregate(fx):
+    """Vectorised aggregates over a columnar fixture."""
+    n_categories = len(fx["labels.category"])
+    n_districts = len(fx["labels.district"])
+    n_ngos = len(fx["labels.ngo"])
+
+    category = fx["campaign.category"]
+    goal = fx["campaign.goal"]
+    raised = fx["campaign.raised"]
+    fundraising = goal > 0
+
+    raised_by_category = np.bincount(category, weights=raised, minlength=n_categories)
+    goal_by_category = np.bincount(category[fundraising], weights=goal[fundraising],
+                                   minlength=n_categories)
+    raised_toward_goal = np.bincount(category[fundraising], weights=raised[fundraising],
+                                     minlength=n_categories)
+    funding_ratio = np.divide(raised_toward_goal, goal_by_category,
+                              out=np.zeros(n_categories), where=goal_by_category > 0)
+
+    ngo = fx["campaign.ngo"]
+    known = ngo >= 0
+    volunteers_by_ngo = np.bincount(ngo[known], weights=fx["campaign.volunteers"][known],
+                                    minlength=n_ngos)
+    campaign_district = fx["ngo.district"][ngo[known]]
+
+    return {
+        "labels.category": fx["labels.category"],
+        "labels.district": fx["labels.district"],
+        "labels.ngo": fx["labels.ngo"],
+        "campaigns_by_category": np.bincount(category, minlength=n_categories),
+        "raised_by_category": raised_by_category,
+        "goal_by_category": goal_by_category,
+        "funding_ratio_by_category": funding_ratio,
+        "volunteers_by_ngo": volunteers_by_ngo,
+        "campaigns_by_district": np.bincount(campaign_district, minlength=n_districts),
+        "ngos_by_district": np.bincount(fx["ngo.district"], minlength=n_districts),
+        "totals": np.array([
+            n_ngos,
+            len(category),
+            raised.sum(),
+            goal[fundraising].sum(),
+            fx["campaign.volunteers"].sum(),
+            fx["campaign.reached"].sum(),
+        ], dtype=np.float64),
+    }
+
+
+TOTALS = ("ngos", "campaigns", "raised", "goal", "volunteers", "reached")
+
+_memo = {}
+
+
+def fixture_aggregates(path=SEED_PATH):
+    """Aggregates for the fixture at *path*, cached by its content hash."""
+    with open(path, "rb") as fh:
+        digest = hashlib.sha256(fh.read()).hexdigest()
+    key = f"v{CACHE_VERSION}-{digest}"
+    if key in _memo:
+        return _memo[key]
+
+    cache_path = os.path.join(CACHE_DIR, f"aggregates-{key}.npz")
+    if os.path.exists(cache_path):
+        with np.load(cache_path) as npz:
+            result = {k: npz[k] for k in npz.files}
+    else:
+        result = aggregate(load_fixture(path))
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = cache_path + f".{os.getpid()}.tmp.npz"
+        np.savez(tmp, **result)
+        os.replace(tmp, cache_path)
+    _memo[key] = result
+    return result
+
+
+def totals(aggregates):
+    return dict(zip(TOTALS, aggregates["totals"].tolist()))
+
+
+def ranked(values, labels, n=None):
+    """``(label, value)`` pairs for the *n* largest *values*, largest first."""
+    values = np.asarray(values)
+    if n is not None and n < len(values):
+        idx = np.argpartition(-values, n - 1)[:n]
+    else:
+        idx = np.arange(len(values))
+    idx = idx[np.argsort(-values[idx], kind="stable")]
+    return [(str(labels[i]), values[i].item()) for i in idx]
+
+
+# ── Active fixture ──────────────────────────────────────────────
+_active_path = SEED_PATH
+
+
+def current():
+    """Aggregates of the fixture the data slides are being built from."""
+    return fixture_aggregates(_active_path)
+
+
+@contextmanager
+def use_fixture(path=SEED_PATH):
+    """Build data slides from *path* (``seed.js`` or a saved ``.npz``).
+
+    Nothing is read until a data slide asks for :func:`current`.
+    """
+    global _active_path
+    saved = _active_path
+    _active_path = path
+    try:
+        yield path
+    finally:
+        _active_path = saved
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m presentation.fixtures",
+        description="Extract seed-data fixtures and print their aggregates.",
+    )
+    parser.add_argument("--fixture", default=SEED_PATH, help="seed.js or .npz fixture")
+    parser.add_argument("--synthetic", type=int, default=None, metavar="ROWS",
+                        help="generate a synthetic fixture with ROWS campaigns")
+    parser.add_argument("-o", "--output", default=None, help="save the fixture as .npz")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    if args.synthetic:
+        fx = synthetic_fixture(args.synthetic)
+    else:
+        fx = load_fixture(args.fixture)
+    loaded = time.perf_counter()
+    if args.output:
+        save_fixture(fx, args.output)
+        print(f"Saved fixture to {args.output}")
+    agg = aggregate(fx)
+    done = time.perf_counter()
+
+    print(f"{len(fx['campaign.goal']):,} campaigns, {len(fx['labels.ngo']):,} NGOs "
+          f"(load {loaded - started:.3f}s, aggregate {done - loaded:.3f}s)")
+    for name, value in totals(agg).items():
+        print(f"  {name:<11} {value:,.0f}")
+    order = np.argsort(-agg["raised_by_category"])
+    for i in order:
+        print(f"  {agg['labels.category'][i]:<22} raised {agg['raised_by_category'][i]:>16,.0f}"
+              f"  funded {agg['funding_ratio_by_category'][i]:6.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""
+String catalogs, per-locale fonts and text metrics.
+
+Every user-visible string lives in ``locales/<code>.json``, keyed by slide
+key and then element (``"roles.cards.0.title"``). Catalogs other than
+English may be partial: any missing leaf falls back to the English text.
+Slide builders call :func:`t` and draw with :func:`current` locale's fonts.
+
+Nothing in this module imports python-pptx.
+"""
+
+import json
+import math
+import os
+import unicodedata
+from contextlib import contextmanager
+
+LOCALES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+DEFAULT_LOCALE = "en"
+
+# Template mode wraps catalog keys in private-use code points so a deck can
+# be built once and have its text substituted per locale afterwards.
+TOKEN_OPEN = "\ue000"
+TOKEN_CLOSE = "\ue001"
+
+_MISSING = object()
+
+
+class Catalog:
+    """One locale's strings and font settings."""
+
+    def __init__(self, code, strings, fallback=None):
+        meta = strings.pop("_meta", {})
+        self.code = code
+        self.name = meta.get("name", code)
+        self.font = meta.get("font") or (fallback.font if fallback else "Calibri")
+        self.cs_font = meta.get("cs_font")
+        self.strings = strings
+        self.fallback = fallback
+
+    def __repr__(self):
+        return f"Catalog({self.code!r})"
+
+    def get(self, key, template=False):
+        """Resolve *key*, falling back leaf-by-leaf to the default locale.
+
+        Dicts and lists are returned with every leaf resolved, so a partial
+        translation of e.g. ``roles.cards`` still yields the full structure.
+        """
+        shape = self._root()._lookup(key)
+        if shape is _MISSING:
+            raise KeyError(f"No string for {key!r}")
+        return self._resolve(key, shape, template)
+
+    def _root(self):
+        return self.fallback._root() if self.fallback else self
+
+    def _lookup(self, key):
+        node = self.strings
+        for part in key.split("."):
+            if isinstance(node, list):
+                try:
+                    node = node[int(part)]
+                except (ValueError, IndexError):
+                    return _MISSING
+            elif isinstance(node, dict) and part in node:
+                node = node[part]
+            else:
+                return _MISSING
+        return node
+
+    def _resolve(self, key, shape, template):
+        if isinstance(shape, dict):
+            return {k: self._resolve(f"{key}.{k}", v, template) for k, v in shape.items()}
+        if isinstance(shape, list):
+            return [self._resolve(f"{key}.{i}", v, template) for i, v in enumerate(shape)]
+        if template:
+            return TOKEN_OPEN + key + TOKEN_CLOSE
+        value = self._lookup(key)
+        if value is _MISSING or not isinstance(value, str):
+            return self.fallback._resolve(key, shape, False) if self.fallback else shape
+        return value
+
+    def substitute(self, text):
+        """Replace template tokens in *text* with this locale's strings."""
+        if TOKEN_OPEN not in text:
+            return text
+        out = []
+        pos = 0
+        while True:
+            start = text.find(TOKEN_OPEN, pos)
+            if start < 0:
+                out.append(text[pos:])
+                return "".join(out)
+            end = text.index(TOKEN_CLOSE, start)
+            out.append(text[pos:start])
+            out.append(self.get(text[start + 1:end]))
+            pos = end + 1
+
+
+_catalogs = {}
+
+
+def load_catalog(code=DEFAULT_LOCALE):
+    """Load (once per process) the catalog for *code*."""
+    catalog = _catalogs.get(code)
+    if catalog is None:
+        path = os.path.join(LOCALES_DIR, code + ".json")
+        if not os.path.exists(path):
+            raise ValueError(f"Unknown locale {code!r}; available: {', '.join(available_locales())}")
+        with open(path, encoding="utf-8") as fh:
+            strings = json.load(fh)
+        fallback = None if code == DEFAULT_LOCALE else load_catalog(DEFAULT_LOCALE)
+        catalog = _catalogs[code] = Catalog(code, strings, fallback)
+    return catalog
+
+
+def available_locales():
+    return sorted(name[:-5] for name in os.listdir(LOCALES_DIR) if name.endswith(".json"))
+
+
+# ── Active locale ───────────────────────────────────────────────
+_active = None
+_template = False
+
+
+def current():
+    """The catalog slides are currently being built in."""
+    global _active
+    if _active is None:
+        _active = load_catalog(DEFAULT_LOCALE)
+    return _active
+
+
+@contextmanager
+def use_locale(code=DEFAULT_LOCALE, template=False):
+    """Build slides in *code*; with *template*, :func:`t` returns key tokens."""
+    global _active, _template
+    saved = _active, _template
+    _active, _template = load_catalog(code), template
+    try:
+        yield _active
+    finally:
+        _active, _template = saved
+
+
+def is_template():
+    """Whether :func:`t` currently returns key tokens instead of text."""
+    return _template
+
+
+def t(key):
+    """Look up *key* in the active locale."""
+    return current().get(key, template=_template)
+
+
+# ── Text metrics ────────────────────────────────────────────────
+EMU_PER_PT = 12700
+
+
+class TextMetrics:
+    """Approximate rendered text width, cached per string.
+
+    Advances are rough per-script averages in ems; they are only used to
+    compare a translation against the English text it replaces.
+    """
+
+    def __init__(self):
+        self._widths = {}
+
+    def width(self, text):
+        """Width of the widest line of *text*, in ems."""
+        cached = self._widths.get(text)
+        if cached is None:
+            lines = text.replace("\v", "\n").split("\n")
+            cached = self._widths[text] = max(sum(map(_advance, line)) for line in lines)
+        return cached
+
+    def lines(self, text, size_pt, box_width):
+        """Estimated number of wrapped lines for *text* in *box_width* EMU."""
+        if box_width <= 0:
+            return 1
+        total = 0
+        for line in text.replace("\v", "\n").split("\n"):
+            em = self.width(line) * size_pt * EMU_PER_PT
+            total += max(1, math.ceil(em / box_width))
+        return total
+
+
+def _advance(ch):
+    if ch == " ":
+        return 0.25
+    category = unicodedata.category(ch)
+    if category == "Mc":  # spacing vowel signs
+        return 0.3
+    if category in ("Mn", "Me", "Cf"):
+        return 0.0
+    if unicodedata.east_asian_width(ch) in ("W", "F"):
+        return 1.0
+    if "\u0900" <= ch <= "\u0dff":  # Indic scripts
+        return 0.62
+    if ch.isupper():
+        return 0.62
+    if ch.isdigit():
+        return 0.51
+    if ch in "iljtf.,:;'|!()[]":
+        return 0.28
+    return 0.5
+
+
+_metrics = {}
+
+
+def metrics_for(code):
+    """The text-width cache for locale *code*."""
+    metrics = _metrics.get(code)
+    if metrics is None:
+        metrics = _metrics[code] = TextMetrics()
+    return metrics
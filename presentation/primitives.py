@@ -0,0 +1,162 @@
+"""
+Drawing primitives and colour palette shared by every slide builder.
+
+This module imports python-pptx eagerly; keep it out of the import path of
+anything that does not render.
+"""
+
+from pptx.util import Inches, Pt, Emu
+from pptx.dml.color import RGBColor
+from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml.ns import qn
+
+from . import i18n
+from .components import Component
+
+# ── Colour palette ──────────────────────────────────────────────
+NAVY      = RGBColor(0x0B, 0x1D, 0x51)
+TEAL      = RGBColor(0x00, 0x96, 0x88)
+WHITE     = RGBColor(0xFF, 0xFF, 0xFF)
+LIGHT_BG  = RGBColor(0xF0, 0xF4, 0xF8)
+DARK_TEXT  = RGBColor(0x1A, 0x1A, 0x2E)
+GREY_TEXT  = RGBColor(0x55, 0x55, 0x55)
+ACCENT_ORANGE = RGBColor(0xFF, 0x6B, 0x35)
+ACCENT_BLUE   = RGBColor(0x1E, 0x88, 0xE5)
+ACCENT_GREEN  = RGBColor(0x43, 0xA0, 0x47)
+ACCENT_PURPLE = RGBColor(0x7B, 0x1F, 0xA2)
+
+SLIDE_W = Inches(13.333)
+SLIDE_H = Inches(7.5)
+
+
+def set_font(font, name=None):
+    """Set *font*'s typeface, defaulting to the active locale's font.
+
+    Locales whose script PowerPoint treats as complex (e.g. Devanagari)
+    also get their ``cs_font`` so the text never falls back to Calibri.
+    """
+    locale = i18n.current()
+    font.name = name or locale.font
+    if locale.cs_font:
+        rPr = font._rPr
+        cs = rPr.find(qn("a:cs"))
+        if cs is None:
+            cs = rPr.makeelement(qn("a:cs"), {})
+            rPr.find(qn("a:latin")).addnext(cs)
+        cs.set("typeface", locale.cs_font)
+
+
+def add_bg_rect(slide, color):
+    """Full-slide background rectangle."""
+    shape = slide.shapes.add_shape(
+        MSO_SHAPE.RECTANGLE, Emu(0), Emu(0),
+        SLIDE_W, SLIDE_H,
+    )
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = color
+    shape.line.fill.background()
+    shape.shadow.inherit = False
+
+
+def add_accent_bar(slide, y=Inches(0), height=Inches(0.06), color=TEAL):
+    shape = slide.shapes.add_shape(
+        MSO_SHAPE.RECTANGLE, Emu(0), y,
+        SLIDE_W, height,
+    )
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = color
+    shape.line.fill.background()
+    shape.shadow.inherit = False
+
+
+def add_text_box(slide, left, top, width, height, text, font_size=18,
+                 bold=False, color=DARK_TEXT, alignment=PP_ALIGN.LEFT,
+                 font_name=None):
+    txBox = slide.shapes.add_textbox(left, top, width, height)
+    tf = txBox.text_frame
+    tf.word_wrap = True
+    p = tf.paragraphs[0]
+    p.text = text
+    p.font.size = Pt(font_size)
+    p.font.bold = bold
+    p.font.color.rgb = color
+    set_font(p.font, font_name)
+    p.alignment = alignment
+    return tf
+
+
+def add_bullet_list(slide, left, top, width, height, items,
+                    font_size=16, color=DARK_TEXT, spacing=Pt(6)):
+    txBox = slide.shapes.add_textbox(left, top, width, height)
+    tf = txBox.text_frame
+    tf.word_wrap = True
+    for i, item in enumerate(items):
+        if i == 0:
+            p = tf.paragraphs[0]
+        else:
+            p = tf.add_paragraph()
+        p.text = item
+        p.font.size = Pt(font_size)
+        p.font.color.rgb = color
+        set_font(p.font)
+        p.space_after = spacing
+        p.level = 0
+    return tf
+
+
+def add_stat_card(slide, left, top, width, height, number, label, color):
+    """Rounded-look stat card."""
+    STAT_CARD.add(slide, left, top, width=width, height=height,
+                  number=str(number), label=label, color=color)
+
+
+def _draw_stat_card(slide, left, top, width, height, number, label, color):
+    shape = slide.shapes.add_shape(
+        MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height,
+    )
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = WHITE
+    shape.line.color.rgb = color
+    shape.line.width = Pt(2)
+    shape.shadow.inherit = False
+
+    tf = shape.text_frame
+    tf.word_wrap = True
+    tf.paragraphs[0].alignment = PP_ALIGN.CENTER
+
+    p = tf.paragraphs[0]
+    p.text = str(number)
+    p.font.size = Pt(36)
+    p.font.bold = True
+    p.font.color.rgb = color
+    set_font(p.font)
+
+    p2 = tf.add_paragraph()
+    p2.text = label
+    p2.font.size = Pt(14)
+    p2.font.color.rgb = GREY_TEXT
+    set_font(p2.font)
+    p2.alignment = PP_ALIGN.CENTER
+
+
+STAT_CARD = Component("stat_card", _draw_stat_card)
+
+
+def add_section_header(slide, title, subtitle=""):
+    """Navy divider slide; drawn once per deck and cloned after that."""
+    SECTION_HEADER.add(slide, title=title, subtitle=subtitle)
+
+
+def _draw_section_header(slide, left, top, title, subtitle):
+    add_bg_rect(slide, NAVY)
+    add_accent_bar(slide, y=Inches(3.5), height=Inches(0.04), color=TEAL)
+    add_text_box(slide, Inches(1), Inches(2.2), Inches(11), Inches(1.2),
+                 title, 44, bold=True, color=WHITE, alignment=PP_ALIGN.CENTER)
+    if subtitle:
+        add_text_box(slide, Inches(1), Inches(3.7), Inches(11), Inches(0.8),
+                     subtitle, 20, color=RGBColor(0xB0, 0xBE, 0xC5),
+                     alignment=PP_ALIGN.CENTER)
+
+
+SECTION_HEADER = Component("section_header", _draw_section_header)
@@ -0,0 +1,152 @@
+"""
+Stub HTTP server that replays recorded API responses.
+
+    python -m presentation.replay                             # bundled sample
+    python -m presentation.replay admin_api.json --port 5099 --delay 0.5
+    API_TOKEN=stub python generate_presentation.py --api http://127.0.0.1:5099/api
+
+Lets the dashboard slide be built and its client exercised without a
+running backend. A recording maps ``"METHOD /path"`` to ``{"status",
+"body"}`` (see ``python -m presentation.dashboard --record``). Like the
+Express backend, responses carry an ETag and answer a matching
+``If-None-Match`` with 304; ``/admin`` routes require a bearer token and
+``POST /api/auth/login`` hands out a stub one. Connections are kept alive.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+SAMPLE_RECORDING = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "recordings", "admin_api.json")
+STUB_TOKEN = "stub-admin-token"
+
+
+class ReplayServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, recording, delay=0.0, verbose=False):
+        super().__init__(address, ReplayHandler)
+        self.delay = delay
+        self.verbose = verbose
+        self.responses = {}
+        for key, entry in recording.items():
+            body = json.dumps(entry.get("body")).encode("utf-8")
+            etag = 'W/"%s"' % hashlib.sha1(body).hexdigest()
+            self.responses[key] = (entry.get("status", 200), body, etag)
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def count(self, new_connection):
+        with self._lock:
+            self.requests += 1
+            self.connections += new_connection
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def setup(self):
+        super().setup()
+        self._served = 0
+
+    def do_GET(self):
+        self._replay("GET")
+
+    def do_POST(self):
+        self._replay("POST")
+
+    def _replay(self, method):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        self.server.count(self._served == 0)
+        self._served += 1
+        if self.server.delay:
+            time.sleep(self.server.delay)
+
+        path = urlsplit(self.path).path
+        if method == "POST" and path.endswith("/auth/login"):
+            return self._send(200, json.dumps({"token": STUB_TOKEN}).encode("utf-8"))
+        if "/admin/" in path and not self.headers.get("Authorization", "").startswith("Bearer "):
+            return self._send(401, b'{"message":"No token, authorization denied"}')
+
+        entry = self.server.responses.get(f"{method} {path}")
+        if entry is None:
+            return self._send(404, b'{"message":"Not recorded"}')
+        status, body, etag = entry
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            return self._send(304, b"", etag)
+        self._send(status, body, etag)
+
+    def _send(self, status, body, etag=None):
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        if status != 304:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+    def log_message(self, fmt, *args):
+        if self.server.verbose:
+            sys.stderr.write(f"[{self.client_address[1]}] {fmt % args}\n")
+
+
+def load_recording(path=SAMPLE_RECORDING):
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def serve(recording=None, host="127.0.0.1", port=0, delay=0.0, verbose=False):
+    """Start a :class:`ReplayServer` on a background thread and return it.
+
+    *port* 0 picks a free port; stop it with ``server.shutdown()``.
+    """
+    server = ReplayServer((host, port), recording or load_recording(), delay, verbose)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m presentation.replay",
+        description="Replay recorded admin API responses over HTTP.",
+    )
+    parser.add_argument("recording", nargs="?", default=SAMPLE_RECORDING,
+                        help="recording JSON (default: bundled sample)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5099)
+    parser.add_argument("--delay", type=float, default=0.0,
+                        help="seconds to wait before each response (simulate a slow API)")
+    args = parser.parse_args(argv)
+
+    server = ReplayServer((args.host, args.port), load_recording(args.recording),
+                          args.delay, verbose=True)
+    print(f"Replaying {args.recording} at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"{server.requests} requests over {server.connections} connections")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,540 @@
+"""
+Full-text index over generated decks.
+
+    python -m presentation.search campaign                 # shapes mentioning "campaign"
+    python -m presentation.search /api/admin "users_rel"   # every term must match
+    python -m presentation.search 'donat*' -n 50            # prefix match
+    python -m presentation.search --add old_deck.pptx       # index an existing deck
+    python -m presentation.search --stats
+    python -m presentation.search --merge
+
+The generator indexes every deck it writes: each text-bearing shape is a
+document keyed by deck path, slide number and shape id (a chart's
+categories and series names count as its text). A build adds one
+immutable *segment* file and updates ``manifest.json``; regenerating a
+deck supersedes its documents in older segments, which are compacted by
+:func:`merge` (automatically past :data:`MERGE_AT` segments).
+
+A segment is a flat little-endian file of ``uint32`` tables (sorted term
+dictionary, postings, documents) plus UTF-8 blobs, so queries ``mmap``
+it and binary-search the terms without parsing anything. Only the
+standard library is needed to query; no ``.pptx`` is opened.
+"""
+
+import argparse
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import time
+import uuid
+from array import array
+from collections import namedtuple
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+DEFAULT_INDEX = os.environ.get("DECK_INDEX") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "ngo-connect-deck", "index",
+)
+MANIFEST = "manifest.json"
+MERGE_AT = 32  # segments before an update compacts the index
+
+Document = namedtuple("Document", "slide shape text")
+Hit = namedtuple("Hit", "deck slide shape text")
+
+# Words, identifiers (users_rel) and Devanagari with its combining signs.
+_TOKEN = re.compile(r"[\w\u0900-\u097f]+")
+
+# magic, then the byte offset and length of each section, 8-byte aligned.
+_MAGIC = b"NGOIDX\x00\x01"
+_SECTIONS = ("deck_offsets", "deck_blob", "docs", "text_offsets", "text_blob",
+             "term_offsets", "term_blob", "posting_offsets", "postings")
+_HEADER = struct.Struct("<8s%dQ" % (2 * len(_SECTIONS)))
+_U32 = "I"
+assert array(_U32).itemsize == 4
+
+
+def tokenize(text):
+    return _TOKEN.findall(text.lower())
+
+
+# ── Collecting ──────────────────────────────────────────────────
+def deck_documents(prs):
+    """:class:`Document` for every text-bearing shape of an in-memory deck."""
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+    from .diff import read_chart
+
+    docs = []
+    for number, slide in enumerate(prs.slides, 1):
+        rels = slide.part.rels
+
+        def charts(rid, rels=rels):
+            rel = rels.get(rid)
+            if rel is None or rel.reltype != RT.CHART:
+                return None
+            return read_chart(rel.target_part._element)
+
+        docs.extend(_tree_documents(number, slide.shapes._spTree, charts))
+    return docs
+
+
+def file_documents(path):
+    """Same as :func:`deck_documents`, read from a saved ``.pptx``."""
+    import zipfile
+
+    from lxml import etree
+
+    from .diff import NS, _chart_reader, _slide_parts
+
+    with zipfile.ZipFile(path) as zf:
+        docs = []
+        for number, part in enumerate(_slide_parts(zf), 1):
+            tree = etree.fromstring(zf.read(part)).find("p:cSld/p:spTree", NS)
+            if tree is not None:
+                docs.extend(_tree_documents(number, tree, _chart_reader(zf, part)))
+    return docs
+
+
+def _tree_documents(number, tree, charts=None):
+    """Documents of a slide's shape tree; *charts* maps a chart rId to a Chart."""
+    from .diff import _iter_shapes, _shape
+
+    for el in _iter_shapes(tree):
+        shape = _shape(el, charts)
+        lines = [shape.text]
+        if shape.chart is not None:
+            lines += [series.name for series in shape.chart.series]
+            lines += shape.chart.categories
+        text = "\n".join(line for line in lines if line).strip()
+        if text:
+            yield Document(number, shape.id, text)
+
+
+# ── Segments ────────────────────────────────────────────────────
+def _u32(values):
+    table = array(_U32, values)
+    if sys.byteorder == "big":
+        table.byteswap()
+    return table.tobytes()
+
+
+def _blob(strings):
+    """UTF-8 concatenation of *strings* and its ``n + 1`` offsets."""
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    return _u32(offsets), b"".join(encoded)
+
+
+def write_segment(path, decks):
+    """Write *decks* (``{deck: [Document, ...]}``) as one segment file."""
+    names = sorted(decks)
+    docs, texts, terms = [], [], {}
+    for deck_id, name in enumerate(names):
+        for doc in decks[name]:
+            doc_id = len(texts)
+            docs.extend((deck_id, doc.slide, doc.shape))
+            texts.append(doc.text)
+            for term in set(tokenize(doc.text)):
+                terms.setdefault(term, []).append(doc_id)
+
+    # Terms sort by their UTF-8 bytes, the order queries compare in.
+    vocabulary = sorted(terms, key=lambda term: term.encode("utf-8"))
+    posting_offsets, postings = [0], []
+    for term in vocabulary:
+        postings.extend(terms[term])
+        posting_offsets.append(len(postings))
+
+    sections = [
+        *_blob(names),
+        _u32(docs),
+        *_blob(texts),
+        *_blob(vocabulary),
+        _u32(posting_offsets),
+        _u32(postings),
+    ]
+    layout, pos = [], _HEADER.size
+    for data in sections:
+        pos += -pos % 8
+        layout += [pos, len(data)]
+        pos += len(data)
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(_HEADER.pack(_MAGIC, *layout))
+        for offset, data in zip(layout[::2], sections):
+            fh.write(b"\0" * (offset - fh.tell()))
+            fh.write(data)
+    os.replace(tmp, path)
+
+
+class Segment:
+    """A memory-mapped segment file.
+
+    *live* names the decks whose documents still count (default: all).
+    """
+
+    def __init__(self, path, live=None):
+        with open(path, "rb") as fh:
+            self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        header = _HEADER.unpack_from(self._map)
+        if header[0] != _MAGIC:
+            raise ValueError(f"{path} is not an index segment")
+        view = memoryview(self._map)
+        bounds = {name: view[start:start + length] for name, start, length
+                  in zip(_SECTIONS, header[1::2], header[2::2])}
+        section = bounds.pop
+
+        self._deck_offsets = self._table(section("deck_offsets"))
+        self._deck_blob = section("deck_blob")
+        self._docs = self._table(section("docs"))
+        self._text_offsets = self._table(section("text_offsets"))
+        self._text_blob = section("text_blob")
+        self._term_offsets = self._table(section("term_offsets"))
+        self._term_blob = section("term_blob")
+        self._posting_offsets = self._table(section("posting_offsets"))
+        self._postings = self._table(section("postings"))
+        self.decks = len(self._deck_offsets) - 1
+        # None: every deck is live, the usual case, so no names are decoded.
+        self.live = None
+        if live is not None and len(live) < self.decks:
+            self.live = {i for i in range(self.decks) if self.deck(i) in live}
+
+    @staticmethod
+    def _table(view):
+        if sys.byteorder == "little":
+            return view.cast(_U32)
+        table = array(_U32, view.tobytes())
+        table.byteswap()
+        return table
+
+    @staticmethod
+    def _string(offsets, blob, i):
+        return bytes(blob[offsets[i]:offsets[i + 1]]).decode("utf-8")
+
+    def deck(self, deck_id):
+        return self._string(self._deck_offsets, self._deck_blob, deck_id)
+
+    def is_live(self, deck_id):
+        return self.live is None or deck_id in self.live
+
+    @property
+    def live_decks(self):
+        return self.decks if self.live is None else len(self.live)
+
+    @property
+    def size(self):
+        return len(self._map)
+
+    @property
+    def terms(self):
+        return len(self._term_offsets) - 1
+
+    @property
+    def documents(self):
+        return len(self._text_offsets) - 1
+
+    def _term(self, i):
+        return bytes(self._term_blob[self._term_offsets[i]:self._term_offsets[i + 1]])
+
+    def _bisect(self, key):
+        lo, hi = 0, self.terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._term(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _posting(self, i):
+        return self._postings[self._posting_offsets[i]:self._posting_offsets[i + 1]]
+
+    def lookup(self, term, prefix=False):
+        """Document ids containing *term* (or any term starting with it)."""
+        key = term.encode("utf-8")
+        i = self._bisect(key)
+        if not prefix:
+            if i < self.terms and self._term(i) == key:
+                return set(self._posting(i))
+            return set()
+        found = set()
+        while i < self.terms and self._term(i).startswith(key):
+            found.update(self._posting(i))
+            i += 1
+        return found
+
+    def document_deck(self, doc_id):
+        return self._docs[doc_id * 3]
+
+    def document(self, doc_id):
+        deck, slide, shape = self._docs[doc_id * 3:doc_id * 3 + 3]
+        return deck, slide, shape, self._string(self._text_offsets, self._text_blob, doc_id)
+
+    def live_documents(self):
+        """``(deck, Document)`` for every document of a live deck."""
+        names = [self.deck(i) for i in range(self.decks)]
+        for doc_id in range(self.documents):
+            deck, slide, shape, text = self.document(doc_id)
+            if self.is_live(deck):
+                yield names[deck], Document(slide, shape, text)
+
+    def close(self):
+        for name in list(vars(self)):
+            if name.startswith("_") and isinstance(getattr(self, name), memoryview):
+                getattr(self, name).release()
+        self._map.close()
+
+
+# ── Index ───────────────────────────────────────────────────────
+@contextmanager
+def _locked(index_dir, timeout=30.0):
+    """Serialise manifest updates between processes.
+
+    The lock is an OS lock on ``manifest.json.lock``, not the file's
+    existence: it is released when its holder exits, however it exits, so
+    a crashed build cannot leave the index locked. The file itself stays.
+    """
+    lock = os.path.join(index_dir, MANIFEST + ".lock")
+    fd = os.open(lock, os.O_CREAT | os.O_RDWR)
+    try:
+        deadline = time.monotonic() + timeout
+        while not _try_lock(fd):
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Index {index_dir} is locked by another process ({lock})")
+            time.sleep(0.02)
+        try:
+            yield
+        finally:
+            if fcntl is None:
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(fd)  # releases the flock
+
+
+def _try_lock(fd):
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _read_manifest(index_dir):
+    try:
+        with open(os.path.join(index_dir, MANIFEST), encoding="utf-8") as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return {"version": 1, "segments": []}
+
+
+def _write_manifest(index_dir, manifest):
+    path = os.path.join(index_dir, MANIFEST)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=1)
+    os.replace(tmp, path)
+
+
+def _new_segment_name():
+    return f"seg-{uuid.uuid4().hex[:12]}.idx"
+
+
+def update(decks, index_dir=DEFAULT_INDEX):
+    """Add or replace *decks* (``{path: [Document, ...]}``) in the index.
+
+    The documents are written as a new segment; any earlier documents for
+    the same decks stop matching at once. Deck paths are made absolute.
+    """
+    decks = {os.path.abspath(path): docs for path, docs in decks.items()}
+    if not decks:
+        return
+    os.makedirs(index_dir, exist_ok=True)
+    name = _new_segment_name()
+    write_segment(os.path.join(index_dir, name), decks)
+
+    with _locked(index_dir):
+        manifest = _read_manifest(index_dir)
+        stale = []
+        for segment in manifest["segments"]:
+            segment["decks"] = [d for d in segment["decks"] if d not in decks]
+            if not segment["decks"]:
+                stale.append(segment)
+        manifest["segments"] = [s for s in manifest["segments"] if s["decks"]]
+        manifest["segments"].append({"file": name, "decks": sorted(decks)})
+        _write_manifest(index_dir, manifest)
+        if len(manifest["segments"]) > MERGE_AT:
+            stale += _merge(index_dir, manifest)
+    _remove_segments(index_dir, stale)
+
+
+def merge(index_dir=DEFAULT_INDEX):
+    """Compact every live document into a single segment."""
+    with _locked(index_dir):
+        stale = _merge(index_dir, _read_manifest(index_dir))
+    _remove_segments(index_dir, stale)
+
+
+def _merge(index_dir, manifest):
+    """Rewrite *manifest*'s live documents as one segment (lock held).
+
+    Returns the segments that are no longer referenced.
+    """
+    if len(manifest["segments"]) < 2:
+        return []
+    decks = {}
+    for entry in manifest["segments"]:
+        segment = Segment(os.path.join(index_dir, entry["file"]), set(entry["decks"]))
+        try:
+            for deck, doc in segment.live_documents():
+                decks.setdefault(deck, []).append(doc)
+        finally:
+            segment.close()
+
+    name = _new_segment_name()
+    write_segment(os.path.join(index_dir, name), decks)
+    stale = manifest["segments"]
+    manifest["segments"] = [{"file": name, "decks": sorted(decks)}]
+    _write_manifest(index_dir, manifest)
+    return stale
+
+
+def _remove_segments(index_dir, entries):
+    for entry in entries:
+        try:
+            os.remove(os.path.join(index_dir, entry["file"]))
+        except FileNotFoundError:
+            pass
+
+
+def _open_segments(index_dir):
+    """``[(segment, live_deck_ids)]`` for the current manifest."""
+    for _ in range(3):
+        opened = []
+        try:
+            for entry in _read_manifest(index_dir)["segments"]:
+                opened.append(Segment(os.path.join(index_dir, entry["file"]),
+                                      set(entry["decks"])))
+            return opened
+        except FileNotFoundError:
+            # A merge replaced the segments between reading and opening.
+            for segment in opened:
+                segment.close()
+    raise RuntimeError(f"Index {index_dir} keeps changing; try again")
+
+
+def search(query, index_dir=DEFAULT_INDEX, limit=None):
+    """Shapes containing every term of *query*; ``term*`` matches a prefix.
+
+    Returns ``(total, hits)`` with *hits* (at most *limit*) ordered by
+    deck, slide and shape. Only the returned hits are decoded.
+    """
+    terms = []
+    for word in query.split():
+        tokens = tokenize(word)
+        prefix = word.endswith("*")
+        terms += [(token, prefix and i == len(tokens) - 1) for i, token in enumerate(tokens)]
+    if not terms:
+        return 0, []
+
+    total, hits = 0, []
+    for segment in _open_segments(index_dir):
+        try:
+            matched = None
+            for term, prefix in terms:
+                found = segment.lookup(term, prefix)
+                matched = found if matched is None else matched & found
+                if not matched:
+                    break
+            if not matched:
+                continue
+            # Documents are stored in (deck, slide, shape) order.
+            matched = sorted(matched)
+            if segment.live is not None:
+                matched = [i for i in matched if segment.is_live(segment.document_deck(i))]
+            total += len(matched)
+            for doc_id in matched[:limit]:
+                deck, slide, shape, text = segment.document(doc_id)
+                hits.append(Hit(segment.deck(deck), slide, shape, text))
+        finally:
+            segment.close()
+    hits.sort()
+    return total, hits[:limit]
+
+
+def stats(index_dir=DEFAULT_INDEX):
+    """Segment, deck, slide, document and term counts plus bytes on disk."""
+    out = {"segments": 0, "decks": 0, "slides": 0, "documents": 0, "terms": 0, "bytes": 0}
+    for segment in _open_segments(index_dir):
+        try:
+            slides = set()
+            for deck, doc in segment.live_documents():
+                slides.add((deck, doc.slide))
+                out["documents"] += 1
+            out["segments"] += 1
+            out["decks"] += segment.live_decks
+            out["slides"] += len(slides)
+            out["terms"] += segment.terms
+            out["bytes"] += segment.size
+        finally:
+            segment.close()
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m presentation.search",
+        description="Find the decks, slides and shapes that mention every given term.",
+    )
+    parser.add_argument("terms", nargs="*", help="terms to match; end one with * for a prefix")
+    parser.add_argument("--index", default=DEFAULT_INDEX, help=f"index directory (default: {DEFAULT_INDEX})")
+    parser.add_argument("-n", "--limit", type=int, default=20, help="hits to print (0: all)")
+    parser.add_argument("--add", nargs="+", default=None, metavar="PPTX",
+                        help="index existing decks (replacing earlier entries)")
+    parser.add_argument("--merge", action="store_true", help="compact the index into one segment")
+    parser.add_argument("--stats", action="store_true", help="print index size and exit")
+    args = parser.parse_args(argv)
+
+    if args.add:
+        update({path: file_documents(path) for path in args.add}, args.index)
+        print(f"Indexed {len(args.add)} deck(s) in {args.index}")
+    if args.merge:
+        merge(args.index)
+        print(f"Merged {args.index}")
+    if args.stats:
+        for key, value in stats(args.index).items():
+            print(f"  {key:<10} {value:,}")
+        return 0
+    if not args.terms:
+        if args.add or args.merge:
+            return 0
+        parser.error("give terms to search for, or --add/--merge/--stats")
+
+    started = time.perf_counter()
+    total, hits = search(" ".join(args.terms), args.index, args.limit or None)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    for hit in hits:
+        text = " ".join(hit.text.split())
+        print(f"{hit.deck}  slide {hit.slide}  shape {hit.shape}")
+        print(f"    {text[:100]}{'…' if len(text) > 100 else ''}")
+    shown = f" (showing {len(hits)})" if len(hits) < total else ""
+    print(f"{total:,} hit(s){shown} in {elapsed:.1f} ms")
+    return 0 if total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,676 @@
+"""
+Slide builders for the architecture deck.
+
+Each ``build_<key>`` function draws one slide onto a blank slide it is
+handed; ordering and titles live in :data:`presentation.deck.SLIDES`.
+Text comes from the active locale's catalog (``locales/<code>.json``)
+under the slide's key; colours and geometry stay here.
+"""
+
+from .primitives import (
+    Inches, Pt, RGBColor, PP_ALIGN, MSO_SHAPE,
+    NAVY, TEAL, WHITE, LIGHT_BG, DARK_TEXT, GREY_TEXT,
+    ACCENT_ORANGE, ACCENT_BLUE, ACCENT_GREEN, ACCENT_PURPLE,
+    add_bg_rect, add_accent_bar, add_text_box, add_bullet_list,
+    add_stat_card, add_section_header, set_font,
+)
+from .charts import Point, add_bar_chart, add_distribution
+from .components import Component
+from .i18n import t
+
+
+def add_slide_title(sl, text):
+    """White content slide with the navy accent bar and heading."""
+    SLIDE_TITLE.add(sl, text=text)
+
+
+def _draw_slide_title(sl, left, top, text):
+    add_bg_rect(sl, WHITE)
+    add_accent_bar(sl, color=NAVY)
+
+    add_text_box(sl, Inches(0.8), Inches(0.5), Inches(11), Inches(0.8),
+                 text, 36, bold=True, color=NAVY)
+
+
+SLIDE_TITLE = Component("slide_title", _draw_slide_title)
+
+
+def build_section(sl, key):
+    add_section_header(sl, t(key + ".title"), t(key + ".subtitle"))
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 1 – TITLE
+# ═══════════════════════════════════════════════════════════════
+def build_title(sl):
+    add_bg_rect(sl, NAVY)
+    add_accent_bar(sl, y=Inches(4.8), height=Inches(0.05), color=TEAL)
+
+    add_text_box(sl, Inches(1), Inches(1.8), Inches(11), Inches(1.5),
+                 t("title.heading"), 56, bold=True, color=WHITE,
+                 alignment=PP_ALIGN.CENTER)
+    add_text_box(sl, Inches(1), Inches(3.3), Inches(11), Inches(1),
+                 t("title.subtitle"), 28, color=TEAL,
+                 alignment=PP_ALIGN.CENTER)
+    add_text_box(sl, Inches(1), Inches(5.2), Inches(11), Inches(0.8),
+                 t("title.tagline"),
+                 18, color=RGBColor(0xB0, 0xBE, 0xC5), alignment=PP_ALIGN.CENTER)
+    add_text_box(sl, Inches(1), Inches(6.3), Inches(11), Inches(0.5),
+                 t("title.date"),
+                 14, color=RGBColor(0x78, 0x90, 0x9C), alignment=PP_ALIGN.CENTER)
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 2 – AGENDA
+# ═══════════════════════════════════════════════════════════════
+def build_agenda(sl):
+    add_slide_title(sl, t("agenda.heading"))
+
+    add_bullet_list(sl, Inches(1.2), Inches(1.6), Inches(10), Inches(5.5),
+                    t("agenda.items"), font_size=20, color=DARK_TEXT, spacing=Pt(10))
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 3 – EXECUTIVE SUMMARY
+# ═══════════════════════════════════════════════════════════════
+def build_summary(sl):
+    add_slide_title(sl, t("summary.heading"))
+
+    add_text_box(sl, Inches(0.8), Inches(1.5), Inches(11.5), Inches(1),
+                 t("summary.intro"), 17, color=DARK_TEXT)
+
+    # Stat cards
+    stats = zip((0.8, 3.7, 6.6, 9.5), ("89", "13", "17", "28+"), t("summary.stats"),
+                (ACCENT_BLUE, TEAL, ACCENT_ORANGE, ACCENT_PURPLE))
+    for left, number, label, color in stats:
+        add_stat_card(sl, Inches(left), Inches(3.2), Inches(2.5), Inches(1.8),
+                      number, label, color)
+
+    add_bullet_list(sl, Inches(0.8), Inches(5.4), Inches(11.5), Inches(2),
+                    t("summary.highlights"), font_size=16, color=GREY_TEXT)
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 4 – SECTION: ARCHITECTURE
+# ═══════════════════════════════════════════════════════════════
+def build_section_architecture(sl):
+    build_section(sl, "section_architecture")
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 5 – HIGH-LEVEL ARCHITECTURE
+# ═══════════════════════════════════════════════════════════════
+def build_architecture(sl):
+    add_slide_title(sl, t("architecture.heading"))
+
+    # Tier boxes
+    tiers = zip(t("architecture.tiers"), (ACCENT_BLUE, TEAL, ACCENT_ORANGE))
+
+    for i, (tier, color) in enumerate(tiers):
+        y = Inches(1.6) + Inches(i * 1.85)
+        shape = sl.shapes.add_shape(
+            MSO_SHAPE.ROUNDED_RECTANGLE,
+            Inches(1.5), y, Inches(10), Inches(1.55),
+        )
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = LIGHT_BG
+        shape.line.color.rgb = color
+        shape.line.width = Pt(2.5)
+        shape.shadow.inherit = False
+
+        tf = shape.text_frame
+        tf.word_wrap = True
+        tf.paragraphs[0].alignment = PP_ALIGN.CENTER
+        p = tf.paragraphs[0]
+        p.text = tier["title"]
+        p.font.size = Pt(22)
+        p.font.bold = True
+        p.font.color.rgb = color
+        set_font(p.font)
+
+        p2 = tf.add_paragraph()
+        p2.text = tier["desc"]
+        p2.font.size = Pt(14)
+        p2.font.color.rgb = GREY_TEXT
+        set_font(p2.font)
+        p2.alignment = PP_ALIGN.CENTER
+
+    # Arrow indicators between tiers
+    for i in range(2):
+        y = Inches(3.15) + Inches(i * 1.85)
+        add_text_box(sl, Inches(5.8), y, Inches(1.5), Inches(0.5),
+                     "▼", 24, bold=True, color=GREY_TEXT, alignment=PP_ALIGN.CENTER)
+
+    # External services note
+    add_text_box(sl, Inches(1), Inches(7), Inches(11), Inches(0.4),
+                 t("architecture.external"),
+                 13, color=GREY_TEXT, alignment=PP_ALIGN.CENTER)
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 6 – TECHNOLOGY STACK
+# ═══════════════════════════════════════════════════════════════
+def build_tech_stack(sl):
+    add_slide_title(sl, t("tech_stack.heading"))
+
+    # Backend column
+    add_text_box(sl, Inches(1), Inches(1.5), Inches(5), Inches(0.5),
+                 t("tech_stack.backend_heading"), 24, bold=True, color=TEAL)
+    add_bullet_list(sl, Inches(1.2), Inches(2.1), Inches(5), Inches(4.5),
+                    t("tech_stack.backend"), font_size=16, color=DARK_TEXT, spacing=Pt(8))
+
+    # Frontend column
+    add_text_box(sl, Inches(7), Inches(1.5), Inches(5), Inches(0.5),
+                 t("tech_stack.frontend_heading"), 24, bold=True, color=ACCENT_BLUE)
+    add_bullet_list(sl, Inches(7.2), Inches(2.1), Inches(5), Inches(4.5),
+                    t("tech_stack.frontend"), font_size=16, color=DARK_TEXT, spacing=Pt(8))
+
+    # Divider
+    shape = sl.shapes.add_shape(
+        MSO_SHAPE.RECTANGLE, Inches(6.5), Inches(1.6), Inches(0.03), Inches(4.5),
+    )
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = RGBColor(0xDD, 0xDD, 0xDD)
+    shape.line.fill.background()
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 7 – USER ROLES & ACCESS CONTROL
+# ═══════════════════════════════════════════════════════════════
+def _draw_role_card(sl, left, top, title, items, color):
+    shape = sl.shapes.add_shape(
+        MSO_SHAPE.ROUNDED_RECTANGLE, left, top,
+        Inches(3.9), Inches(5.2),
+    )
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = LIGHT_BG
+    shape.line.color.rgb = color
+    shape.line.width = Pt(2)
+    shape.shadow.inherit = False
+
+    add_text_box(sl, left + Inches(0.3), top + Inches(0.2), Inches(3.3), Inches(0.6),
+                 title, 18, bold=True, color=color)
+    add_bullet_list(sl, left + Inches(0.3), top + Inches(0.9), Inches(3.3), Inches(4),
+                    items, font_size=13, color=DARK_TEXT, spacing=Pt(6))
+
+
+ROLE_CARD = Component("role_card", _draw_role_card)
+
+
+def build_roles(sl):
+    add_slide_title(sl, t("roles.heading"))
+
+    roles = zip(t("roles.cards"), (ACCENT_BLUE, TEAL, ACCENT_ORANGE))
+
+    for i, (role, color) in enumerate(roles):
+        ROLE_CARD.add(sl, Inches(0.5) + Inches(i * 4.2), Inches(1.6),
+                      title=role["title"], items=role["items"], color=color)
+
+    add_text_box(sl, Inches(0.8), Inches(7), Inches(11), Inches(0.4),
+                 t("roles.footer"),
+                 13, color=GREY_TEXT, alignment=PP_ALIGN.CENTER)
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 8 – SECTION: CORE FEATURES
+# ═══════════════════════════════════════════════════════════════
+def build_section_features(sl):
+    build_section(sl, "section_features")
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 9 – FEATURE MODULES OVERVIEW
+# ═══════════════════════════════════════════════════════════════
+def _draw_feature_card(sl, left, top, title, desc, color):
+    shape = sl.shapes.add_shape(
+        MSO_SHAPE.ROUNDED_RECTANGLE, left, top,
+        Inches(3.9), Inches(2.3),
+    )
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = WHITE
+    shape.line.color.rgb = color
+    shape.line.width = Pt(2)
+    shape.shadow.inherit = False
+
+    add_text_box(sl, left + Inches(0.25), top + Inches(0.25),
+                 Inches(3.4), Inches(0.5),
+                 title, 20, bold=True, color=color)
+    add_text_box(sl, left + Inches(0.25), top + Inches(0.85),
+                 Inches(3.4), Inches(1.2),
+                 desc, 13, color=GREY_TEXT)
+
+
+FEATURE_CARD = Component("feature_card", _draw_feature_card)
+
+
+def build_features(sl):
+    add_slide_title(sl, t("features.heading"))
+
+    features = zip(t("features.cards"), (
+        ACCENT_BLUE, TEAL, ACCENT_ORANGE, ACCENT_GREEN, ACCENT_PURPLE,
+        RGBColor(0xE5, 0x39, 0x35),
+    ))
+
+    for i, (card, color) in enumerate(features):
+        row = i // 3
+        col = i % 3
+        FEATURE_CARD.add(sl, Inches(0.5) + Inches(col * 4.2), Inches(1.5) + Inches(row * 2.8),
+                         title=card["title"], desc=card["desc"], color=color)
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 10 – SECTION: DATABASE
+# ═══════════════════════════════════════════════════════════════
+def build_section_database(sl):
+    build_section(sl, "section_database")
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 11 – DATABASE TABLES
+# ═══════════════════════════════════════════════════════════════
+def build_database(sl):
+    add_slide_title(sl, t("database.heading"))
+
+    add_text_box(sl, Inches(0.8), Inches(1.3), Inches(11), Inches(0.7),
+                 t("database.design"),
+                 15, color=GREY_TEXT)
+
+    # Primary tables
+    add_text_box(sl, Inches(0.8), Inches(2.1), Inches(5.5), Inches(0.5),
+                 t("database.primary_heading"), 20, bold=True, color=TEAL)
+    add_bullet_list(sl, Inches(1), Inches(2.7), Inches(6.5), Inches(4.5),
+                    t("database.primary"), font_size=12, color=DARK_TEXT, spacing=Pt(3))
+
+    # Junction tables
+    add_text_box(sl, Inches(8), Inches(2.1), Inches(4.5), Inches(0.5),
+                 t("database.junction_heading"), 20, bold=True, color=ACCENT_ORANGE)
+    add_bullet_list(sl, Inches(8.2), Inches(2.7), Inches(4.3), Inches(3),
+                    t("database.junction"), font_size=13, color=DARK_TEXT, spacing=Pt(8))
+
+    # Key relationships
+    add_text_box(sl, Inches(8), Inches(4.8), Inches(4.5), Inches(0.5),
+                 t("database.relationships_heading"), 20, bold=True, color=ACCENT_BLUE)
+    add_bullet_list(sl, Inches(8.2), Inches(5.4), Inches(4.3), Inches(2),
+                    t("database.relationships"), font_size=13, color=DARK_TEXT, spacing=Pt(4))
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 12 – SECTION: API
+# ═══════════════════════════════════════════════════════════════
+def build_section_api(sl):
+    build_section(sl, "section_api")
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 13 – API ENDPOINT SUMMARY
+# ═══════════════════════════════════════════════════════════════
+def build_api_distribution(sl):
+    def header(slide, page):
+        add_slide_title(slide, t("api_distribution.heading_cont" if page
+                                 else "api_distribution.heading"))
+
+    header(sl, 0)
+
+    api_modules = [
+        Point("/api/admin", 18, ACCENT_ORANGE),
+        Point("/api/volunteering", 12, TEAL),
+        Point("/api/campaigns", 11, ACCENT_BLUE),
+        Point("/api/donations", 8, ACCENT_GREEN),
+        Point("/api/ngos", 7, ACCENT_PURPLE),
+        Point("/api/messages", 7, RGBColor(0xE5, 0x39, 0x35)),
+        Point("/api/ai", 6, RGBColor(0xFF, 0xB3, 0x00)),
+        Point("/api/categories", 5, TEAL),
+        Point("/api/auth", 4, ACCENT_BLUE),
+        Point("/api/requests", 4, ACCENT_ORANGE),
+        Point("/api/users", 3, ACCENT_GREEN),
+        Point("/api/certificates", 3, ACCENT_PURPLE),
+        Point("/api/notifications", 1, GREY_TEXT),
+    ]
+    add_distribution(sl, api_modules, header=header, per_chart=7, columns=2,
+                     top=Inches(1.4), height=Inches(4.9))
+
+    add_text_box(sl, Inches(0.5), Inches(6.6), Inches(12), Inches(0.6),
+                 t("api_distribution.footer"),
+                 13, color=GREY_TEXT, alignment=PP_ALIGN.CENTER)
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 14 – KEY API HIGHLIGHTS
+# ═══════════════════════════════════════════════════════════════
+def build_api_highlights(sl):
+    add_slide_title(sl, t("api_highlights.heading"))
+
+    add_bullet_list(sl, Inches(0.8), Inches(1.5), Inches(5.5), Inches(5),
+                    t("api_highlights.left"), font_size=14, color=DARK_TEXT, spacing=Pt(4))
+    add_bullet_list(sl, Inches(7), Inches(1.5), Inches(5.5), Inches(5),
+                    t("api_highlights.right"), font_size=14, color=DARK_TEXT, spacing=Pt(4))
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 15 – SECTION: WORKFLOWS
+# ═══════════════════════════════════════════════════════════════
+def build_section_workflows(sl):
+    build_section(sl, "section_workflows")
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 16 – DONATION WORKFLOW
+# ═══════════════════════════════════════════════════════════════
+def build_workflows(sl):
+    add_slide_title(sl, t("workflows.heading"))
+
+    steps = t("workflows.steps")
+    colors = (ACCENT_BLUE, TEAL, ACCENT_ORANGE, ACCENT_GREEN, ACCENT_PURPLE,
+              RGBColor(0xE5, 0x39, 0x35))
+
+    for i, (desc, color) in enumerate(zip(steps, colors)):
+        left = Inches(0.3) + Inches(i * 2.1)
+        # Circle number
+        circ = sl.shapes.add_shape(
+            MSO_SHAPE.OVAL, left + Inches(0.65), Inches(1.8),
+            Inches(0.7), Inches(0.7),
+        )
+        circ.fill.solid()
+        circ.fill.fore_color.rgb = color
+        circ.line.fill.background()
+
+        tf = circ.text_frame
+        tf.paragraphs[0].text = str(i + 1)
+        tf.paragraphs[0].font.size = Pt(24)
+        tf.paragraphs[0].font.bold = True
+        tf.paragraphs[0].font.color.rgb = WHITE
+        tf.paragraphs[0].alignment = PP_ALIGN.CENTER
+
+        add_text_box(sl, left + Inches(0.1), Inches(2.7),
+                     Inches(1.8), Inches(1.2),
+                     desc, 13, color=DARK_TEXT, alignment=PP_ALIGN.CENTER)
+
+        # Arrow between steps
+        if i < len(steps) - 1:
+            add_text_box(sl, left + Inches(1.7), Inches(1.9),
+                         Inches(0.5), Inches(0.5),
+                         "→", 24, bold=True, color=GREY_TEXT, alignment=PP_ALIGN.CENTER)
+
+    add_text_box(sl, Inches(0.5), Inches(4.3), Inches(12), Inches(0.5),
+                 t("workflows.payment_note"),
+                 15, color=GREY_TEXT, alignment=PP_ALIGN.CENTER)
+
+    # Volunteer workflow
+    add_text_box(sl, Inches(0.8), Inches(5.2), Inches(11), Inches(0.6),
+                 t("workflows.volunteer_heading"), 28, bold=True, color=NAVY)
+    add_bullet_list(sl, Inches(1), Inches(5.9), Inches(11), Inches(1.5),
+                    t("workflows.volunteer_steps"), font_size=14, color=DARK_TEXT, spacing=Pt(4))
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 17 – SECTION: AI
+# ═══════════════════════════════════════════════════════════════
+def build_section_ai(sl):
+    build_section(sl, "section_ai")
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 18 – AI FEATURES
+# ═══════════════════════════════════════════════════════════════
+def _draw_ai_card(sl, left, top, title, desc, color):
+    shape = sl.shapes.add_shape(
+        MSO_SHAPE.ROUNDED_RECTANGLE, left, top,
+        Inches(5.9), Inches(2.3),
+    )
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = LIGHT_BG
+    shape.line.color.rgb = color
+    shape.line.width = Pt(2)
+    shape.shadow.inherit = False
+
+    add_text_box(sl, left + Inches(0.3), top + Inches(0.2),
+                 Inches(5.3), Inches(0.7),
+                 title, 18, bold=True, color=color)
+    add_text_box(sl, left + Inches(0.3), top + Inches(0.9),
+                 Inches(5.3), Inches(1.2),
+                 desc, 13, color=DARK_TEXT)
+
+
+AI_CARD = Component("ai_card", _draw_ai_card)
+
+
+def build_ai_features(sl):
+    add_slide_title(sl, t("ai_features.heading"))
+
+    ai_features = zip(t("ai_features.cards"),
+                      (ACCENT_BLUE, TEAL, ACCENT_ORANGE, ACCENT_PURPLE))
+
+    for i, (card, color) in enumerate(ai_features):
+        col = i % 2
+        row = i // 2
+        AI_CARD.add(sl, Inches(0.5) + Inches(col * 6.3), Inches(1.5) + Inches(row * 2.7),
+                    title=card["title"], desc=card["desc"], color=color)
+
+
+# ── Seed-data helpers ───────────────────────────────────────────
+def _count(n):
+    """Compact count for a stat card: 1,572 / 55.9K / 1.0M / 2.5B."""
+    for scale, suffix in ((1e9, "B"), (1e6, "M"), (1e3, "K")):
+        if n >= 100_000 and n >= scale:
+            return f"{n / scale:.1f}{suffix}"
+    return f"{n:,.0f}"
+
+
+def _inr_unit(value):
+    """(divisor, suffix) to show rupee amounts around *value* in crore/lakh."""
+    if value >= 10_000_000:
+        return 10_000_000, " Cr"
+    if value >= 100_000:
+        return 100_000, " L"
+    return 1, ""
+
+
+def _inr(value):
+    divisor, suffix = _inr_unit(value)
+    amount = value / divisor
+    return f"₹{amount:,.{1 if suffix and amount < 100 else 0}f}{suffix}"
+
+
+def add_data_chart(sl, left, heading, pairs, color, number_format="0"):
+    """Sub-heading plus a bar chart of ``(label, value)`` pairs below it."""
+    add_text_box(sl, left, Inches(3.2), Inches(5.9), Inches(0.5),
+                 heading, 18, bold=True, color=color)
+    if pairs:
+        add_bar_chart(sl, left, Inches(3.7), Inches(5.9), Inches(3.4),
+                      [Point(label, value) for label, value in pairs],
+                      number_format=number_format, font_size=11, default_color=color)
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 19 – SEED DATA: FUNDRAISING
+# ═══════════════════════════════════════════════════════════════
+def build_data_fundraising(sl):
+    from . import fixtures  # NumPy is only needed by the data slides
+
+    add_slide_title(sl, t("data_fundraising.heading"))
+
+    agg = fixtures.current()
+    totals = fixtures.totals(agg)
+    funded = totals["raised"] / totals["goal"] if totals["goal"] else 0
+
+    stats = zip((0.8, 3.7, 6.6, 9.5),
+                (_count(totals["ngos"]), _count(totals["campaigns"]),
+                 _inr(totals["raised"]), f"{funded:.0%}"),
+                t("data_fundraising.stats"),
+                (ACCENT_BLUE, TEAL, ACCENT_GREEN, ACCENT_ORANGE))
+    for left, number, label, color in stats:
+        add_stat_card(sl, Inches(left), Inches(1.4), Inches(2.5), Inches(1.5),
+                      number, label, color)
+
+    labels = agg["labels.category"]
+    raised = fixtures.ranked(agg["raised_by_category"], labels, 7)
+    top = raised[0][1] if raised else 0
+    divisor, suffix = _inr_unit(top)
+    digits = "#,##0.0" if suffix and top / divisor < 100 else "#,##0"
+    add_data_chart(sl, Inches(0.5), t("data_fundraising.raised_heading"),
+                   [(label, value / divisor) for label, value in raised if value],
+                   ACCENT_GREEN, number_format=f'"₹"{digits}"{suffix}"')
+
+    has_goal = agg["goal_by_category"] > 0
+    add_data_chart(sl, Inches(6.9), t("data_fundraising.funded_heading"),
+                   fixtures.ranked(agg["funding_ratio_by_category"][has_goal],
+                                   labels[has_goal], 7),
+                   ACCENT_ORANGE, number_format="0%")
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 20 – SEED DATA: VOLUNTEERS & REACH
+# ═══════════════════════════════════════════════════════════════
+def build_data_engagement(sl):
+    from . import fixtures
+
+    add_slide_title(sl, t("data_engagement.heading"))
+
+    agg = fixtures.current()
+    totals = fixtures.totals(agg)
+    districts = int((agg["campaigns_by_district"] > 0).sum())
+    per_campaign = totals["volunteers"] / totals["campaigns"] if totals["campaigns"] else 0
+
+    stats = zip((0.8, 3.7, 6.6, 9.5),
+                (_count(totals["volunteers"]), _count(totals["reached"]),
+                 str(districts), f"{per_campaign:.0f}"),
+                t("data_engagement.stats"),
+                (TEAL, ACCENT_BLUE, ACCENT_PURPLE, ACCENT_ORANGE))
+    for left, number, label, color in stats:
+        add_stat_card(sl, Inches(left), Inches(1.4), Inches(2.5), Inches(1.5),
+                      number, label, color)
+
+    add_data_chart(sl, Inches(0.5), t("data_engagement.volunteers_heading"),
+                   fixtures.ranked(agg["volunteers_by_ngo"], agg["labels.ngo"], 7),
+                   TEAL)
+    add_data_chart(sl, Inches(6.9), t("data_engagement.districts_heading"),
+                   fixtures.ranked(agg["campaigns_by_district"], agg["labels.district"], 7),
+                   ACCENT_PURPLE)
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 21 – SECTION: FRONTEND
+# ═══════════════════════════════════════════════════════════════
+def build_section_frontend(sl):
+    build_section(sl, "section_frontend")
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 22 – FRONTEND PAGES
+# ═══════════════════════════════════════════════════════════════
+def _draw_page_group(sl, left, top, title, items, color):
+    add_text_box(sl, left, top, Inches(3.9), Inches(0.5),
+                 title, 20, bold=True, color=color)
+
+    shape = sl.shapes.add_shape(
+        MSO_SHAPE.ROUNDED_RECTANGLE, left, top + Inches(0.6),
+        Inches(3.9), Inches(4.5),
+    )
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = LIGHT_BG
+    shape.line.color.rgb = color
+    shape.line.width = Pt(1.5)
+    shape.shadow.inherit = False
+
+    add_bullet_list(sl, left + Inches(0.2), top + Inches(0.8),
+                    Inches(3.5), Inches(4),
+                    items, font_size=12, color=DARK_TEXT, spacing=Pt(8))
+
+
+PAGE_GROUP = Component("page_group", _draw_page_group)
+
+
+def build_frontend_pages(sl):
+    add_slide_title(sl, t("frontend_pages.heading"))
+
+    page_groups = zip(t("frontend_pages.groups"), (ACCENT_BLUE, TEAL, ACCENT_ORANGE))
+
+    for i, (group, color) in enumerate(page_groups):
+        PAGE_GROUP.add(sl, Inches(0.4) + Inches(i * 4.2), Inches(1.5),
+                       title=group["title"], items=group["items"], color=color)
+
+    add_text_box(sl, Inches(0.5), Inches(6.9), Inches(12), Inches(0.5),
+                 t("frontend_pages.footer"),
+                 13, color=GREY_TEXT, alignment=PP_ALIGN.CENTER)
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 23 – DEPLOYMENT & CONFIG
+# ═══════════════════════════════════════════════════════════════
+def build_deployment(sl):
+    add_slide_title(sl, t("deployment.heading"))
+
+    add_text_box(sl, Inches(0.8), Inches(1.5), Inches(5.5), Inches(0.5),
+                 t("deployment.env_heading"), 22, bold=True, color=TEAL)
+    add_bullet_list(sl, Inches(1), Inches(2.1), Inches(5.5), Inches(3),
+                    t("deployment.env"), font_size=14, color=DARK_TEXT, spacing=Pt(5))
+
+    add_text_box(sl, Inches(7), Inches(1.5), Inches(5), Inches(0.5),
+                 t("deployment.commands_heading"), 22, bold=True, color=ACCENT_BLUE)
+    add_bullet_list(sl, Inches(7.2), Inches(2.1), Inches(5), Inches(3),
+                    t("deployment.commands"), font_size=14, color=DARK_TEXT, spacing=Pt(5))
+
+    add_text_box(sl, Inches(0.8), Inches(5), Inches(11), Inches(0.5),
+                 t("deployment.credentials_heading"), 22, bold=True, color=ACCENT_ORANGE)
+    add_bullet_list(sl, Inches(1), Inches(5.6), Inches(11), Inches(1.5),
+                    t("deployment.credentials"), font_size=15, color=DARK_TEXT, spacing=Pt(6))
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 24 – THANK YOU
+# ═══════════════════════════════════════════════════════════════
+def build_closing(sl):
+    add_bg_rect(sl, NAVY)
+    add_accent_bar(sl, y=Inches(4.6), height=Inches(0.05), color=TEAL)
+
+    add_text_box(sl, Inches(1), Inches(2.2), Inches(11), Inches(1.2),
+                 t("closing.heading"), 56, bold=True, color=WHITE, alignment=PP_ALIGN.CENTER)
+    add_text_box(sl, Inches(1), Inches(3.5), Inches(11), Inches(0.8),
+                 t("closing.subtitle"), 28, color=TEAL, alignment=PP_ALIGN.CENTER)
+    add_text_box(sl, Inches(1), Inches(5.0), Inches(11), Inches(1),
+                 t("closing.footer"),
+                 16, color=RGBColor(0xB0, 0xBE, 0xC5), alignment=PP_ALIGN.CENTER)
+
+
+# ═══════════════════════════════════════════════════════════════
+# SLIDE 25 – APPENDIX: ADMIN DASHBOARD SNAPSHOT
+# ═══════════════════════════════════════════════════════════════
+def build_dashboard(sl):
+    from . import dashboard  # the HTTP client is only needed with --api
+
+    add_slide_title(sl, t("dashboard.heading"))
+
+    snapshot = dashboard.current()
+    stats = snapshot.dashboard.get("stats", {})
+    analytics = snapshot.analytics
+
+    cards = zip((0.8, 3.7, 6.6, 9.5),
+                (_inr(stats.get("donationsCompletedTotal", 0)),
+                 _count(stats.get("volunteerApplicationsCount", 0)),
+                 _count(stats.get("flaggedTotal", 0)),
+                 _count(stats.get("pendingNgos", 0))),
+                t("dashboard.stats"),
+                (ACCENT_GREEN, TEAL, RGBColor(0xE5, 0x39, 0x35), ACCENT_ORANGE))
+    for left, number, label, color in cards:
+        add_stat_card(sl, Inches(left), Inches(1.4), Inches(2.5), Inches(1.5),
+                      number, label, color)
+
+    months = analytics.get("donationsByMonth", [])[-6:]
+    top = max((m.get("total", 0) for m in months), default=0)
+    divisor, suffix = _inr_unit(top)
+    digits = "#,##0.0" if suffix and top / divisor < 100 else "#,##0"
+    add_data_chart(sl, Inches(0.5), t("dashboard.donations_heading"),
+                   [(m["month"], m.get("total", 0) / divisor) for m in months],
+                   ACCENT_GREEN, number_format=f'"₹"{digits}"{suffix}"')
+
+    roles = analytics.get("usersByRole", {})
+    add_data_chart(sl, Inches(6.9), t("dashboard.roles_heading"),
+                   [(label, roles.get(role, 0)) for role, label in t("dashboard.roles").items()],
+                   ACCENT_BLUE)
+
+    generated = str(snapshot.dashboard.get("generatedAt", ""))[:16].replace("T", " ")
+    source = f"{t('dashboard.source')}  {snapshot.api}  •  {generated} {t('dashboard.utc')}"
+    if dashboard.CACHED in snapshot.sources.values():
+        source += f"  ({t('dashboard.cached')})"
+    add_text_box(sl, Inches(0.5), Inches(7.0), Inches(12.3), Inches(0.4),
+                 source, 11, color=GREY_TEXT, alignment=PP_ALIGN.RIGHT)
@@ -0,0 +1,87 @@
+"""Dashboard API client against the replay stub (no backend needed)."""
+
+import time
+
+import pytest
+
+from presentation import dashboard, replay
+from presentation.dashboard import CACHED, FRESH, NOT_MODIFIED, ApiError
+
+
+@pytest.fixture
+def server():
+    server = replay.serve()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def no_credentials(monkeypatch):
+    for name in ("API_TOKEN", "ADMIN_EMAIL", "ADMIN_PASSWORD"):
+        monkeypatch.delenv(name, raising=False)
+
+
+def fetch(server, cache_dir, **kwargs):
+    kwargs.setdefault("token", replay.STUB_TOKEN)
+    return dashboard.fetch_snapshot(server.url, cache_dir=str(cache_dir), **kwargs)
+
+
+def test_fresh_fetch(server, tmp_path):
+    recording = replay.load_recording()
+    snapshot = fetch(server, tmp_path)
+
+    assert snapshot.api == server.url
+    assert snapshot.sources == {"dashboard": FRESH, "analytics": FRESH}
+    assert snapshot.dashboard == recording["GET /api/admin/dashboard"]["body"]
+    assert snapshot.analytics == recording["GET /api/admin/analytics"]["body"]
+
+
+def test_revalidates_with_etag(server, tmp_path):
+    first = fetch(server, tmp_path)
+    second = fetch(server, tmp_path)
+
+    assert second.sources == {"dashboard": NOT_MODIFIED, "analytics": NOT_MODIFIED}
+    assert second.dashboard == first.dashboard
+    assert second.analytics == first.analytics
+
+
+def test_login_and_connection_reuse(server, tmp_path, monkeypatch):
+    monkeypatch.setenv("ADMIN_EMAIL", "admin@ngoconnect.org")
+    monkeypatch.setenv("ADMIN_PASSWORD", "password123")
+
+    snapshot = fetch(server, tmp_path, token=None)
+
+    assert snapshot.sources == {"dashboard": FRESH, "analytics": FRESH}
+    # Login plus one request per endpoint, over at most one connection each.
+    assert server.requests == 1 + len(dashboard.ENDPOINTS)
+    assert server.connections <= len(dashboard.ENDPOINTS)
+    assert server.connections < server.requests
+
+
+def test_missing_credentials(server, tmp_path):
+    with pytest.raises(ApiError, match="No API credentials"):
+        fetch(server, tmp_path, token=None)
+
+
+def test_falls_back_to_cache_when_slow(server, tmp_path):
+    fresh = fetch(server, tmp_path)
+    server.delay = 1.0
+
+    started = time.perf_counter()
+    snapshot = fetch(server, tmp_path, timeout=0.2)
+    elapsed = time.perf_counter() - started
+
+    assert snapshot.sources == {"dashboard": CACHED, "analytics": CACHED}
+    assert snapshot.dashboard == fresh.dashboard
+    assert elapsed < server.delay
+
+
+def test_unavailable_without_cache(tmp_path):
+    server = replay.serve()
+    url = server.url
+    server.shutdown()
+    server.server_close()
+
+    with pytest.raises(ApiError, match="no cached snapshot"):
+        dashboard.fetch_snapshot(url, token="x", timeout=0.5, cache_dir=str(tmp_path))
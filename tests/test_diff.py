@@ -0,0 +1,115 @@
+"""Slide and shape alignment on small synthetic decks."""
+
+import json
+
+from presentation.diff import (
+    Chart, Series, Shape, Slide, _digest, align, diff_decks, format_report,
+)
+
+GEOMETRY = (0, 0, 100, 50)
+
+
+def shape(text, shape_id=2, chart=None):
+    kind = "graphicFrame:chart" if chart else "sp:rect"
+    return Shape(shape_id, f"Shape {shape_id}", kind, GEOMETRY, text, None, chart,
+                 _digest(kind, GEOMETRY, text, None, chart))
+
+
+def slide(*shapes):
+    shapes = [s if isinstance(s, Shape) else shape(s) for s in shapes]
+    return Slide(0, shapes, _digest(*(s.sig for s in shapes)))
+
+
+def deck(*slides):
+    return [s._replace(number=n) for n, s in enumerate(slides, 1)]
+
+
+def diff(old, new):
+    result = diff_decks(old, new)
+    assert json.loads(json.dumps(result)) == result
+    return result
+
+
+def counts(result):
+    """Non-zero slide counts of *result*'s summary."""
+    return {k: v for k, v in result["summary"].items()
+            if v and not k.startswith("slides_")}
+
+
+def statuses(result):
+    return [(e["status"], e["old"], e["new"], e["title"]) for e in result["slides"]]
+
+
+A, B, C, D = slide("Alpha"), slide("Beta"), slide("Gamma"), slide("Delta")
+
+
+def test_identical():
+    result = diff(deck(A, B, C), deck(A, B, C))
+    assert counts(result) == {"unchanged": 3}
+    assert result["slides"] == []
+
+
+def test_inserted_slide():
+    result = diff(deck(A, B, C), deck(A, slide("New"), B, C))
+    assert counts(result) == {"unchanged": 3, "added": 1}
+    assert result["summary"]["slides_old"] == 3
+    assert result["summary"]["slides_new"] == 4
+    assert statuses(result) == [("added", None, 2, "New")]
+
+
+def test_removed_slide():
+    result = diff(deck(A, B, C), deck(A, C))
+    assert counts(result) == {"unchanged": 2, "removed": 1}
+    assert statuses(result) == [("removed", 2, None, "Beta")]
+
+
+def test_moved_slide():
+    result = diff(deck(A, B, C, D), deck(A, C, D, B))
+    assert counts(result) == {"unchanged": 3, "moved": 1}
+    assert statuses(result) == [("moved", 2, 4, "Beta")]
+
+
+def test_duplicate_signatures():
+    # Repeated slides never anchor the alignment but still pair up in order.
+    S = slide("Section")
+    result = diff(deck(A, S, B, S), deck(A, S, B, S, S))
+    assert counts(result) == {"unchanged": 4, "added": 1}
+    assert statuses(result) == [("added", None, 5, "Section")]
+
+    result = diff(deck(S, S, S), deck(S))
+    assert counts(result) == {"unchanged": 1, "removed": 2}
+
+
+def test_modified_slide_in_gap():
+    result = diff(deck(A, B, C), deck(A, slide("Beta", shape("Extra", 3)), C))
+    assert counts(result) == {"unchanged": 2, "modified": 1}
+    entry = result["slides"][0]
+    assert (entry["status"], entry["old"], entry["new"]) == ("modified", 2, 2)
+    assert entry["shapes"]["added"] == [{
+        "name": "Shape 3", "type": "sp:rect", "geometry": list(GEOMETRY),
+        "text": "Extra", "fill": None, "chart": None,
+    }]
+    assert entry["shapes"]["removed"] == entry["shapes"]["modified"] == []
+
+
+def test_chart_value_change():
+    def chart(values):
+        return Chart(("/api/admin", "/api/ai"),
+                     (Series("value", values, ("1A237E", "1A237E")),))
+
+    old = deck(A, slide(shape("", chart=chart(("12", "6")))))
+    new = deck(A, slide(shape("", chart=chart(("12", "18")))))
+    result = diff(old, new)
+
+    assert counts(result) == {"unchanged": 1, "modified": 1}
+    (change,) = result["slides"][0]["shapes"]["modified"]
+    assert change["changes"] == ["chart"]
+    assert change["old"]["chart"] == {
+        "categories": ["/api/admin", "/api/ai"],
+        "series": [{"name": "value", "values": ["12", "6"], "fills": ["1A237E", "1A237E"]}],
+    }
+    assert change["new"]["chart"]["series"][0]["values"] == ["12", "18"]
+
+    report = format_report(result, "old.pptx", "new.pptx")
+    assert "/api/ai" in report and "18" in report
+    assert "/api/admin" not in report
@@ -0,0 +1,112 @@
+"""Search index segments, superseding, merging and build integration."""
+
+import json
+import os
+
+import pytest
+
+from presentation import IndexWarning, render, search
+from presentation.search import Document, Segment, write_segment
+
+DOCS = {
+    "b.pptx": [
+        Document(1, 2, "Users table: users_rel"),
+        Document(2, 5, "दान अभियान"),
+    ],
+    "a.pptx": [Document(3, 4, "Donations and donors")],
+}
+
+
+def ids(segment, term, prefix=False):
+    return sorted(segment.lookup(term, prefix))
+
+
+def test_segment_round_trip(tmp_path):
+    path = str(tmp_path / "seg.idx")
+    write_segment(path, DOCS)
+    segment = Segment(path)
+    try:
+        assert segment.decks == 2
+        assert [segment.deck(i) for i in range(segment.decks)] == ["a.pptx", "b.pptx"]
+        assert segment.documents == 3
+        # Documents are stored in deck order: a.pptx first.
+        assert segment.document(0) == (0, 3, 4, "Donations and donors")
+        assert segment.document(2) == (1, 2, 5, "दान अभियान")
+
+        assert ids(segment, "users_rel") == [1]
+        assert ids(segment, "users") == [1]
+        assert ids(segment, "दान") == [2]
+        assert ids(segment, "अभि") == []
+        assert ids(segment, "अभि", prefix=True) == [2]
+        assert ids(segment, "donat", prefix=True) == [0]
+        assert ids(segment, "don", prefix=True) == [0]
+        assert ids(segment, "missing") == []
+        assert ids(segment, "zzz", prefix=True) == []
+    finally:
+        segment.close()
+
+
+def test_search_all_terms_and_prefix(tmp_path):
+    search.update(DOCS, str(tmp_path))
+
+    total, hits = search.search("table users_r*", str(tmp_path))
+    assert total == 1
+    assert hits[0].deck == os.path.abspath("b.pptx")
+    assert (hits[0].slide, hits[0].shape) == (1, 2)
+
+    assert search.search("दान", str(tmp_path))[0] == 1
+    assert search.search("donor* users", str(tmp_path))[0] == 0
+    assert search.search("", str(tmp_path)) == (0, [])
+
+
+def test_reindex_hides_older_documents(tmp_path):
+    index = str(tmp_path)
+    search.update(DOCS, index)
+    search.update({"b.pptx": [Document(1, 2, "Campaigns table")]}, index)
+
+    manifest = json.loads((tmp_path / search.MANIFEST).read_text())
+    assert [entry["decks"] for entry in manifest["segments"]] == [
+        [os.path.abspath("a.pptx")], [os.path.abspath("b.pptx")],
+    ]
+    assert search.search("users_rel", index)[0] == 0
+    assert search.search("दान", index)[0] == 0
+    assert search.search("campaigns", index)[0] == 1
+    assert search.search("donors", index)[0] == 1
+
+    # A segment is deleted once every deck in it has been re-indexed.
+    search.update({"a.pptx": [Document(1, 1, "Donors")]}, index)
+    manifest = json.loads((tmp_path / search.MANIFEST).read_text())
+    assert sorted(name for name in os.listdir(index) if name.endswith(".idx")) == sorted(
+        entry["file"] for entry in manifest["segments"])
+    assert len(manifest["segments"]) == 2
+
+
+def test_merge_keeps_only_live_documents(tmp_path):
+    index = str(tmp_path)
+    search.update(DOCS, index)
+    search.update({"b.pptx": [Document(1, 2, "Campaigns table")]}, index)
+    search.merge(index)
+
+    manifest = json.loads((tmp_path / search.MANIFEST).read_text())
+    assert len(manifest["segments"]) == 1
+    assert sorted(name for name in os.listdir(index) if name.endswith(".idx")) == [
+        manifest["segments"][0]["file"],
+    ]
+    assert search.stats(index) == {
+        "segments": 1, "decks": 2, "slides": 2, "documents": 2,
+        "terms": 5, "bytes": os.path.getsize(os.path.join(index, manifest["segments"][0]["file"])),
+    }
+    assert search.search("users_rel", index)[0] == 0
+    assert search.search("campaigns", index)[0] == 1
+
+
+def test_render_warns_when_index_unwritable(tmp_path):
+    output = str(tmp_path / "deck.pptx")
+    index = tmp_path / "index"
+    index.write_text("not a directory")
+
+    with pytest.warns(IndexWarning, match="not updated"):
+        count = render(output, slides="1", index=str(index))
+
+    assert count == 1
+    assert os.path.getsize(output) > 0